@@ -7,7 +7,8 @@ on the asset's UUID.
 
 It delegates:
 - Group resolution and routing logic to the `routing_controller`.
-- Streaming the request to the downstream service via `asset_stream_proxy`.
+- Streaming the request to the downstream service via `asset_stream_proxy`, which
+  evicts the cached route of the asset if its group service cannot be reached.
 
 This endpoint supports streaming protocols (e.g., Server-Sent Events),
 making it suitable for real-time data delivery.
@@ -16,25 +17,33 @@ Endpoints:
     - GET /asset_stream?asset_uuid=... : Proxies the request to the correct group service.
 
 Raises:
+    - HTTP 400: If a forwarded query parameter is repeated.
     - HTTP 404: If the asset UUID is not mapped to any group.
     - HTTP 502: If the proxy operation fails due to upstream errors.
 """
 
 import logging
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
-from starlette.responses import StreamingResponse
-from urllib.parse import urlencode
+from starlette.responses import Response, StreamingResponse
+from urllib.parse import urlencode, quote_plus
 from typing import Union
 from routing_layer.app.dependencies import routing_controller
 from routing_layer.app.core.proxy import asset_stream_proxy
 
+# Query parameters forwarded to the group services in addition to 'asset_uuid' (extend as needed)
+ALLOWED_STREAM_PARAMS = frozenset({"id", "start_time", "end_time"})
+
+# Prebuilt 502 error response (static body, no JSON encoding per request)
+ERR_502_PROXY = Response(
+    content=b'{"detail":"Failed to proxy request to group service"}',
+    status_code=502, media_type="application/json")
+
 logger = logging.getLogger("uvicorn.error")
 router = APIRouter()
 
 
 @router.get("/asset_stream", tags=["Asset Stream"], response_model=None)
-async def route_asset_stream(request: Request, asset_uuid: str) -> Union[StreamingResponse, JSONResponse]:
+async def route_asset_stream(request: Request, asset_uuid: str) -> Union[StreamingResponse, Response]:
     """
     Route client requests for asset data streams.
 
@@ -48,12 +57,21 @@ async def route_asset_stream(request: Request, asset_uuid: str) -> Union[Streami
         asset_uuid (str): The UUID of the asset to route.
 
     Raises:
+        HTTPException 400: If a forwarded query parameter is repeated.
         HTTPException 404: If no group service is found for the given asset UUID.
 
     Returns:
         StreamingResponse: A streamed response proxying data from the downstream service.
     """
-    logger.debug(f"[router] Received asset_uuid: {asset_uuid}")
+    logger.debug("[router] Received asset_uuid: %s", asset_uuid)
+
+    # Filter query parameters: whitelist only allowed keys to forward
+    extra_params = [(k, v) for k, v in request.query_params.multi_items() if k in ALLOWED_STREAM_PARAMS]
+
+    # Downstream services accept a single value per key: reject duplicates before any upstream work
+    keys = [k for k, _ in extra_params]
+    if len(keys) != len(set(keys)) or len(request.query_params.getlist("asset_uuid")) > 1:
+        raise HTTPException(status_code=400, detail="Duplicate query parameters are not supported")
 
     # Resolve target base URL from routing controller
     target_url = routing_controller.handle_client_request(asset_uuid)
@@ -61,19 +79,15 @@ async def route_asset_stream(request: Request, asset_uuid: str) -> Union[Streami
         logger.warning(f"[router] No route found for asset_uuid {asset_uuid}")
         raise HTTPException(status_code=404, detail="Asset group not found")
 
-    # Filter query parameters: whitelist only allowed keys to forward (e.g., 'asset_uuid', 'id', etc.)
-    allowed_params = {"asset_uuid", "id", "start_time", "end_time"}  # example allowed keys
-    filtered_params = {k: v for k, v in request.query_params.items() if k in allowed_params}
-
-    query_string = urlencode(filtered_params)
-    full_url = f"{target_url}/asset_stream?{query_string}" if query_string else target_url
+    # The validated asset_uuid is encoded directly; only the other allowed keys go through urlencode
+    query_string = "asset_uuid=" + quote_plus(asset_uuid, safe="")
+    if extra_params:
+        query_string += "&" + urlencode(extra_params, doseq=True)
+    full_url = f"{target_url}/asset_stream?{query_string}"
 
     # Call proxy_request to stream upstream response
     try:
-        return await asset_stream_proxy(request, full_url)
+        return await asset_stream_proxy(request, full_url, asset_uuid)
     except Exception as e:
         logger.exception(f"[router] Error proxying request to {full_url}: {e}")
-        return JSONResponse(
-            status_code=502,
-            content={"detail": "Failed to proxy request to group service"}
-        )
+        return ERR_502_PROXY
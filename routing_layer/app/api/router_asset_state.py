@@ -7,10 +7,15 @@ to resolve the service's location and proxies the request transparently.
 
 Responsibilities:
 - Forward all relevant query parameters to the downstream Asset State API.
-- Preserve method and headers for full request fidelity.
-- Return the exact response (status code + content) from the backend.
+- Preserve method and forward a whitelist of end-to-end request headers
+  (hop-by-hop headers such as `Host` or `Connection` are not forwarded).
+- Return the exact response (status code + content) from the backend, streamed
+  as raw bytes without decoding or re-encoding the JSON payload.
+- Drop the cached State API URL when it cannot be connected to, so that it is
+  resolved again on the next request.
 
 Raises:
+    - HTTP 400: If a forwarded query parameter is repeated.
     - HTTP 404: If the state API is unreachable or misconfigured.
     - HTTP 502: If the proxy fails to connect to the backend service.
 """
@@ -18,71 +23,139 @@ Raises:
 import logging
 import httpx
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
-from urllib.parse import urlencode
+from starlette.background import BackgroundTask
+from starlette.responses import Response, StreamingResponse
+from urllib.parse import urlencode, quote_plus
 from typing import Optional
 from routing_layer.app.dependencies import routing_controller
 
+# Query parameters forwarded to the State API in addition to 'asset_uuid' (extend as needed)
+ALLOWED_STATE_PARAMS = frozenset({"id", "start_time", "end_time", "granularity"})
+
+# Upstream bodies up to this size (in bytes) are relayed in a single response instead of being streamed
+STREAM_THRESHOLD = 64 * 1024
+
+# Request headers forwarded to the State API
+FORWARD_HEADERS = ("authorization", "accept", "accept-encoding", "x-request-id", "traceparent")
+
+# Prebuilt 502 error responses (static bodies, no JSON encoding per request)
+ERR_502_CONNECT_TIMEOUT = Response(
+    content=b'{"detail":"Timeout connecting to the State API."}',
+    status_code=502, media_type="application/json")
+ERR_502_READ_TIMEOUT = Response(
+    content=b'{"detail":"Timeout reading response from the State API."}',
+    status_code=502, media_type="application/json")
+ERR_502_REQUEST = Response(
+    content=b'{"detail":"Error contacting the State API."}',
+    status_code=502, media_type="application/json")
+ERR_502_UNEXPECTED = Response(
+    content=b'{"detail":"Unexpected error proxying to State API."}',
+    status_code=502, media_type="application/json")
+
 logger = logging.getLogger("uvicorn.error")
 router = APIRouter()
 
 
 @router.get("/asset_state", tags=["Asset State"])
-async def route_asset_state(request: Request, asset_uuid: str) -> JSONResponse:
+async def route_asset_state(request: Request, asset_uuid: str) -> Response:
     """
     Proxy client requests for asset state data to the centralized state API.
 
     This endpoint:
     - Receives an asset UUID and other filters as query parameters.
     - Forwards the request to the downstream State API.
-    - Returns the streamed or JSON response back to the client.
+    - Streams the raw response body back to the client, preserving status code and content type.
 
     Args:
         request (Request): The incoming FastAPI request object.
         asset_uuid (str): The UUID of the asset.
 
     Returns:
-        StreamingResponse: The response from the State API.
+        Response: The streamed response from the State API, or a prebuilt
+        502 JSON error response if the proxy fails to reach the backend.
 
     Raises:
         HTTPException:
+            - 400 if a forwarded query parameter is repeated.
             - 404 if the target API cannot be resolved.
-            - 502 if the proxy fails to connect to the backend.
     """
-    logger.debug(f"[router] Proxying asset state for UUID: {asset_uuid}")
+    logger.debug("[router] Proxying asset state for UUID: %s", asset_uuid)
+
+    # Filter query parameters: whitelist only allowed keys to forward
+    extra_params = [(k, v) for k, v in request.query_params.multi_items() if k in ALLOWED_STATE_PARAMS]
+
+    # Downstream services accept a single value per key: reject duplicates before any upstream work
+    keys = [k for k, _ in extra_params]
+    if len(keys) != len(set(keys)) or len(request.query_params.getlist("asset_uuid")) > 1:
+        raise HTTPException(status_code=400, detail="Duplicate query parameters are not supported")
 
-    # Get the base URL from the deployment platform
-    target_base_url: Optional[str] = routing_controller.deployment_platform.get_state_api_url()
-    logger.debug(f"[router] Baser URL: {target_base_url}")
-    if not target_base_url:
+    # Get the endpoint URL from the deployment platform (precomputed by the routing controller)
+    target_url: Optional[str] = routing_controller.state_api_asset_state_url
+    logger.debug("[router] Target URL: %s", target_url)
+    if not target_url:
         logger.error("[router] Asset State API route could not be resolved.")
         raise HTTPException(status_code=404, detail="Asset State API not available.")
 
-    # Allowed query parameters to forward (extend this list as needed)
-    allowed_params = {"asset_uuid", "id", "start_time", "end_time", "granularity"}
-    filtered_params = {k: v for k, v in request.query_params.items() if k in allowed_params}
-
     # Construct full downstream URL
-    query_string = urlencode(filtered_params)
-    full_url = f"{target_base_url}/asset_state"
-    if query_string:
-        full_url = f"{full_url}?{query_string}"
+    # The validated asset_uuid is encoded directly; only the other allowed keys go through urlencode
+    query_string = "asset_uuid=" + quote_plus(asset_uuid, safe="")
+    if extra_params:
+        query_string += "&" + urlencode(extra_params, doseq=True)
+    full_url = f"{target_url}?{query_string}"
 
-    logger.debug(f"[router] Forwarding request to: {full_url}")
+    logger.debug("[router] Forwarding request to: %s", full_url)
 
     # Proxy the request
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            proxy_response = await client.get(full_url, headers=dict(request.headers))
-
-        return JSONResponse(
+        client: httpx.AsyncClient = request.app.state.http_client
+        headers = {h: v for h in FORWARD_HEADERS if (v := request.headers.get(h))}
+        # Bodies are relayed raw, so never let httpx negotiate an encoding the client did not ask for
+        headers.setdefault("accept-encoding", "identity")
+        upstream_request = client.build_request("GET", full_url, headers=headers)
+        proxy_response = await client.send(upstream_request, stream=True)
+
+        # Raw bytes are forwarded as-is, so any upstream content encoding must be preserved
+        response_headers = {}
+        if "content-encoding" in proxy_response.headers:
+            response_headers["content-encoding"] = proxy_response.headers["content-encoding"]
+        media_type = proxy_response.headers.get("content-type", "application/json")
+
+        # Small bodies of known length are relayed in one piece, avoiding the streaming machinery
+        content_length = proxy_response.headers.get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) <= STREAM_THRESHOLD:
+            try:
+                body = b"".join([chunk async for chunk in proxy_response.aiter_raw()])
+            finally:
+                await proxy_response.aclose()
+            return Response(
+                content=body,
+                status_code=proxy_response.status_code,
+                headers=response_headers,
+                media_type=media_type
+            )
+
+        return StreamingResponse(
+            proxy_response.aiter_raw(),
             status_code=proxy_response.status_code,
-            content=proxy_response.json()
+            headers=response_headers,
+            media_type=media_type,
+            background=BackgroundTask(proxy_response.aclose)
         )
 
+    except httpx.ConnectTimeout as e:
+        logger.error(f"[router] Timeout connecting to State API: {e}")
+        routing_controller.invalidate_state_api_url()
+        return ERR_502_CONNECT_TIMEOUT
+    except httpx.ConnectError as e:
+        logger.error(f"[router] Error connecting to State API: {e}")
+        routing_controller.invalidate_state_api_url()
+        return ERR_502_REQUEST
+    except httpx.ReadTimeout as e:
+        logger.error(f"[router] Timeout reading response from State API: {e}")
+        return ERR_502_READ_TIMEOUT
     except httpx.RequestError as e:
         logger.exception(f"[router] HTTPX error proxying to State API: {e}")
-        raise HTTPException(status_code=502, detail="Error contacting the State API.")
+        return ERR_502_REQUEST
     except Exception as e:
         logger.exception(f"[router] Unexpected error proxying to State API: {e}")
-        raise HTTPException(status_code=502, detail="Unexpected error proxying to State API.")
+        return ERR_502_UNEXPECTED
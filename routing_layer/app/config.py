@@ -48,25 +48,52 @@ State API (used for asset state lookups):
     - `STATE_API_REPLICAS`: Number of replicas for the state API (default: 1)
     - `STATE_API_CPU_LIMIT`: CPU limit per state API container (default: 0.5)
     - `STATE_API_CPU_RESERVATION`: CPU reservation per state API container (default: 0.25)
+    - `HTTP_TIMEOUTS`: JSON object with per-stage timeouts in seconds (keys: "connect", "read", "write", "pool")
+      used when proxying to the state API (default: {"connect": 1.0, "read": 5.0, "write": 2.0, "pool": 0.5})
+    - `HTTP_MAX_CONNECTIONS`: Maximum number of concurrent upstream connections of the shared request client
+      (State API proxy and readiness probes; asset streams use a separate client) (default: 512)
+    - `HTTP_MAX_KEEPALIVE_CONNECTIONS`: Maximum number of idle upstream connections kept alive by the request client
+      (default: 128)
+    - `HTTP_STREAM_MAX_CONNECTIONS`: Maximum number of concurrent proxied asset streams (default: 2048)
+    - `HTTP_STREAM_MAX_KEEPALIVE_CONNECTIONS`: Maximum number of idle upstream connections kept alive by the stream client
+      (default: 32)
 
 Platform & Deployment Strategy:
     - `DOCKER_NETWORK`: Docker Swarm overlay network name (default: "factory-net")
     - `SWARM_NODE_HOST`: Host or IP address of the Swarm manager node (default: "localhost")
     - `DEPLOYMENT_PLATFORM`: Deployment backend to use: "docker", "swarm", etc. (default: "swarm")
+      or a dotted import path `package.module:Class`
     - `GROUPING_STRATEGY`: Asset grouping strategy, e.g., "workcenter" (default: "workcenter")
+      or a dotted import path `package.module:Class`
 
 Environment & Logging:
     - `ENVIRONMENT`: Current environment ("local", "dev", "devswarm", or "production"; default: "production")
     - `LOG_LEVEL`: Logging level ("debug", "info", "warning", "error", "critical"; default: "info")
+
+ASGI Server:
+    - `UVICORN_LOOP`: Event loop implementation used by Uvicorn ("auto", "asyncio", "uvloop"; default: "uvloop")
+    - `UVICORN_HTTP`: HTTP protocol implementation used by Uvicorn ("auto", "h11", "httptools"; default: "httptools")
+    - `UVICORN_WORKERS`: Number of Uvicorn worker processes; 0 starts one per CPU (default: 1).
+      Ignored in the "local" environment, which runs a single auto-reloading process.
 """
 
 import logging
+from typing import Dict
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
 from openfactory import __version__ as OPENFACTORY_VERSION
 from openfactory.kafka import KSQLDBClient
 
 
+ALLOWED_LOG_LEVELS = frozenset({"debug", "info", "warning", "error", "critical"})
+ALLOWED_ENVIRONMENTS = frozenset({"local", "dev", "devswarm", "production"})
+
+# Default per-stage HTTP timeouts (in seconds) used when proxying to the State API
+DEFAULT_HTTP_TIMEOUTS = {"connect": 1.0, "read": 5.0, "write": 2.0, "pool": 0.5}
+
+logger = logging.getLogger("uvicorn.error")
+
+
 class Settings(BaseSettings):
     """
     Application configuration settings loaded from environment variables.
@@ -118,14 +145,36 @@ class Settings(BaseSettings):
             Environment variable: `STATE_API_CPU_LIMIT`. Default: 0.5.
         state_api_cpus_reservation (float): CPU reservation per asset state API container.
             Environment variable: `STATE_API_CPU_RESERVATION`. Default: 0.25.
+        http_timeouts (Dict[str, float]): Per-stage timeouts (in seconds) used when proxying to the state API.
+            Keys are "connect", "read", "write" and "pool"; missing keys fall back to their defaults.
+            Environment variable: `HTTP_TIMEOUTS` (JSON object).
+            Default: {"connect": 1.0, "read": 5.0, "write": 2.0, "pool": 0.5}.
+        http_max_connections (int): Maximum number of concurrent upstream connections of the shared request client.
+            Proxied asset streams use a separate client and do not count towards this limit.
+            Environment variable: `HTTP_MAX_CONNECTIONS`. Default: 512.
+        http_max_keepalive_connections (int): Maximum number of idle upstream connections kept alive by the request client.
+            Environment variable: `HTTP_MAX_KEEPALIVE_CONNECTIONS`. Default: 128.
+        http_stream_max_connections (int): Maximum number of concurrent upstream connections of the stream client.
+            Each proxied asset stream holds one connection while open.
+            Environment variable: `HTTP_STREAM_MAX_CONNECTIONS`. Default: 2048.
+        http_stream_max_keepalive_connections (int): Maximum number of idle upstream connections kept alive by the stream client.
+            Environment variable: `HTTP_STREAM_MAX_KEEPALIVE_CONNECTIONS`. Default: 32.
         log_level (str): Logging verbosity level for the service.
             Environment variable: `LOG_LEVEL`. Default: "info".
         environment (str): Environment the app is running in ("local", "dev", "devswarm", or "production").
             Environment variable: `ENVIRONMENT`. Default: "production".
         grouping_strategy (str): Strategy for grouping assets (e.g., "workcenter").
+            A dotted import path (`package.module:Class`) loads the class directly.
             Environment variable: `GROUPING_STRATEGY`. Default: "workcenter".
         deployment_platform (str): Deployment mode, either "swarm" or "docker".
+            A dotted import path (`package.module:Class`) loads the class directly.
             Environment variable: `DEPLOYMENT_PLATFORM`. Default: "swarm".
+        uvicorn_loop (str): Event loop implementation used by Uvicorn ("auto", "asyncio" or "uvloop").
+            Environment variable: `UVICORN_LOOP`. Default: "uvloop".
+        uvicorn_http (str): HTTP protocol implementation used by Uvicorn ("auto", "h11" or "httptools").
+            Environment variable: `UVICORN_HTTP`. Default: "httptools".
+        uvicorn_workers (int): Number of Uvicorn worker processes (0 starts one per CPU).
+            Environment variable: `UVICORN_WORKERS`. Default: 1.
     """
 
     # Kafka & ksqlDB
@@ -166,11 +215,21 @@ class Settings(BaseSettings):
     state_api_replicas: int = Field(default=1, env="STATE_API_REPLICAS")
     state_api_cpus_limit: float = Field(default=0.5, env="STATE_API_CPU_LIMIT")
     state_api_cpus_reservation: float = Field(default=0.25, env="STATE_API_CPU_RESERVATION")
+    http_timeouts: Dict[str, float] = Field(default_factory=lambda: dict(DEFAULT_HTTP_TIMEOUTS), env="HTTP_TIMEOUTS")
+    http_max_connections: int = Field(default=512, env="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(default=128, env="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    http_stream_max_connections: int = Field(default=2048, env="HTTP_STREAM_MAX_CONNECTIONS")
+    http_stream_max_keepalive_connections: int = Field(default=32, env="HTTP_STREAM_MAX_KEEPALIVE_CONNECTIONS")
 
     # Miscellaneous
     log_level: str = Field(default="info", env="LOG_LEVEL")
     environment: str = Field(default="production", env="ENVIRONMENT")
 
+    # ASGI server
+    uvicorn_loop: str = Field(default="uvloop", env="UVICORN_LOOP")
+    uvicorn_http: str = Field(default="httptools", env="UVICORN_HTTP")
+    uvicorn_workers: int = Field(default=1, ge=0, env="UVICORN_WORKERS")
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
@@ -180,22 +239,32 @@ class Settings(BaseSettings):
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v):
-        allowed = {"debug", "info", "warning", "error", "critical"}
         level = v.lower()
-        if level not in allowed:
-            raise ValueError(f"log_level must be one of {allowed}")
-        logging.getLogger("uvicorn.error").setLevel(level.upper())
+        if level not in ALLOWED_LOG_LEVELS:
+            raise ValueError(f"log_level must be one of {sorted(ALLOWED_LOG_LEVELS)}")
+        logger.setLevel(level.upper())
         return level
 
     @field_validator("environment")
     @classmethod
     def validate_environment(cls, v):
-        allowed = {"local", "dev", "devswarm", "production"}
-        if v.lower() not in allowed:
-            raise ValueError(f"environment must be one of {allowed}")
-        return v.lower()
+        environment = v.lower()
+        if environment not in ALLOWED_ENVIRONMENTS:
+            raise ValueError(f"environment must be one of {sorted(ALLOWED_ENVIRONMENTS)}")
+        return environment
+
+    @field_validator("http_timeouts")
+    @classmethod
+    def validate_http_timeouts(cls, v):
+        unknown = set(v) - set(DEFAULT_HTTP_TIMEOUTS)
+        if unknown:
+            raise ValueError(f"http_timeouts keys must be among {set(DEFAULT_HTTP_TIMEOUTS)}")
+        return {**DEFAULT_HTTP_TIMEOUTS, **v}
 
 
 # Singleton settings object
 settings = Settings()
 ksql = KSQLDBClient(settings.ksqldb_url)
+
+# Settings read on hot paths, resolved once at import
+FASTAPI_GROUP_HOST_PORT_BASE = settings.fastapi_group_host_port_base
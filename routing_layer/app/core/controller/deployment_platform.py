@@ -14,17 +14,38 @@ Usage:
       per logical group.
 """
 
-import hashlib
+import asyncio
+import zlib
 import httpx
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 from abc import ABC, abstractmethod
-from routing_layer.app.config import settings
+from routing_layer.app.config import FASTAPI_GROUP_HOST_PORT_BASE
 from routing_layer.app.core.logger import get_logger
 
 
 logger = get_logger("uvicorn.error")
 
 
+@lru_cache(maxsize=4096)
+def _compute_host_port(group_name: str, base: int) -> int:
+    """
+    Compute the host port for a group from a hash-based (CRC32) offset.
+
+    Memoized at module level so the cache is shared across platform instances.
+
+    Args:
+        group_name (str): Group name used to derive the port.
+        base (int): Base host port.
+
+    Returns:
+        int: Host port to bind.
+    """
+    h = zlib.crc32(group_name.encode())
+    return base + (h % 1000)  # Allows for up to 1000 unique ports
+
+
 class DeploymentPlatform(ABC):
     """
     Abstract base class defining the deployment interface for routing-layer components.
@@ -37,19 +58,36 @@ class DeploymentPlatform(ABC):
 
     - Deployment Phase:
         - `deploy_service(group_name)`: Start a new service instance for a group.
+        - `deploy_services(group_names)`: Start the service instances of several groups.
         - `deploy_routing_layer_api()`: Deploy the central routing layer API service.
 
     - Runtime Phase:
         - `get_service_url(group_name)`: Retrieve the URL of the deployed group service.
         - `check_service_ready(group_name)`: Check if the service is up and ready to receive traffic.
+        - `check_services_ready(group_names)`: Check several services concurrently.
 
     - Teardown:
         - `remove_service(group_name)`: Remove a deployed group service.
+        - `remove_services(group_names)`: Remove the deployed services of several groups.
         - `remove_routing_layer_api()`: Remove the central routing layer API service.
 
+    - Async wrappers (`adeploy_service`, `aremove_service`, `adeploy_state_api`, `adeploy_routing_layer_api`):
+        Run the blocking deployment calls in worker threads, with at most
+        `ASYNC_CONTROL_CONCURRENCY` calls in flight, so they can be awaited from the event loop.
+
     Subclasses must implement these methods using the underlying infrastructure (e.g., Docker, k8s).
     """
 
+    DEPLOY_WORKERS = 10
+    ASYNC_CONTROL_CONCURRENCY = 16
+
+    def __init__(self) -> None:
+        """ Initialize the readiness probe state shared by all deployment platforms. """
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._owns_http_client = False
+        self._readiness_urls: Dict[str, str] = {}
+        self._control_sem: Optional[asyncio.Semaphore] = None
+
     @abstractmethod
     def initialize(self) -> None:
         """
@@ -82,6 +120,20 @@ class DeploymentPlatform(ABC):
         """
         raise NotImplementedError("deploy_service() must be implemented by subclasses.")
 
+    def deploy_services(self, group_names: Iterable[str]) -> None:
+        """
+        Deploy the services associated with several groups.
+
+        The default implementation calls `deploy_service()` for each group concurrently,
+        using up to `DEPLOY_WORKERS` threads. Subclasses may override it to batch
+        backend calls (e.g., a single existence check for all groups).
+
+        Args:
+            group_names (Iterable[str]): The names of the groups to deploy the services for.
+        """
+        with ThreadPoolExecutor(max_workers=self.DEPLOY_WORKERS) as executor:
+            list(executor.map(self.deploy_service, group_names))
+
     @abstractmethod
     def remove_service(self, group_name: str) -> None:
         """
@@ -95,6 +147,19 @@ class DeploymentPlatform(ABC):
         """
         raise NotImplementedError("remove_service() must be implemented by subclasses.")
 
+    def remove_services(self, group_names: Iterable[str]) -> None:
+        """
+        Remove the services associated with several groups.
+
+        The default implementation calls `remove_service()` for each group concurrently,
+        using up to `DEPLOY_WORKERS` threads. Subclasses may override it to batch backend calls.
+
+        Args:
+            group_names (Iterable[str]): The names of the groups whose services should be removed.
+        """
+        with ThreadPoolExecutor(max_workers=self.DEPLOY_WORKERS) as executor:
+            list(executor.map(self.remove_service, group_names))
+
     @abstractmethod
     def deploy_routing_layer_api(self) -> None:
         """
@@ -133,12 +198,113 @@ class DeploymentPlatform(ABC):
         """
         raise NotImplementedError("get_service_url() must be implemented by subclasses.")
 
-    def check_service_ready(self, group_name: str) -> Tuple[bool, str]:
+    def use_http_client(self, client: httpx.AsyncClient) -> None:
+        """
+        Use an application-wide HTTP client for readiness probes.
+
+        Args:
+            client (httpx.AsyncClient): The shared client (owned and closed by the caller).
+        """
+        self._http_client = client
+        self._owns_http_client = False
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        Pooled HTTP client used for readiness probes.
+
+        Returns the client set by `use_http_client()`, or creates a dedicated one on first use.
+
+        Returns:
+            httpx.AsyncClient: Async client kept alive across readiness probes.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=2.0,
+                limits=httpx.Limits(max_keepalive_connections=50)
+            )
+            self._owns_http_client = True
+        return self._http_client
+
+    async def _run_control(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking deployment call in a worker thread, bounded by `ASYNC_CONTROL_CONCURRENCY`.
+
+        Args:
+            func (Callable): The blocking method to run.
+            *args: Positional arguments passed to `func`.
+
+        Returns:
+            Any: The value returned by `func`.
+        """
+        if self._control_sem is None:
+            self._control_sem = asyncio.Semaphore(self.ASYNC_CONTROL_CONCURRENCY)
+        async with self._control_sem:
+            return await asyncio.to_thread(func, *args)
+
+    async def adeploy_service(self, group_name: str) -> None:
+        """
+        Awaitable version of `deploy_service()`.
+
+        Args:
+            group_name (str): The name of the group to deploy the service for.
+        """
+        await self._run_control(self.deploy_service, group_name)
+
+    async def aremove_service(self, group_name: str) -> None:
+        """
+        Awaitable version of `remove_service()`.
+
+        Args:
+            group_name (str): The name of the group whose service should be removed.
+        """
+        await self._run_control(self.remove_service, group_name)
+
+    async def adeploy_state_api(self) -> None:
+        """ Awaitable version of `deploy_state_api()`. """
+        await self._run_control(self.deploy_state_api)
+
+    async def adeploy_routing_layer_api(self) -> None:
+        """ Awaitable version of `deploy_routing_layer_api()`. """
+        await self._run_control(self.deploy_routing_layer_api)
+
+    def close(self) -> None:
+        """
+        Release the connections held to the deployment backend.
+
+        Called by the `RoutingController` at the end of the teardown phase.
+        The default implementation does nothing.
+        """
+
+    async def aclose(self) -> None:
+        """ Close the readiness probe client if it was created by the platform itself. """
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+        self._http_client = None
+        self._owns_http_client = False
+
+    def _get_readiness_url(self, group_name: str) -> str:
+        """
+        Return the `/ready` URL of the service of a group, computed once per group.
+
+        Args:
+            group_name (str): The name of the group.
+
+        Returns:
+            str: The readiness URL of the group service.
+        """
+        url = self._readiness_urls.get(group_name)
+        if url is None:
+            url = f"{self.get_service_url(group_name).rstrip('/')}/ready"
+            self._readiness_urls[group_name] = url
+        return url
+
+    async def check_service_ready(self, group_name: str) -> Tuple[bool, str]:
         """
         Check whether the service for the specified group is ready to accept requests.
 
-        Sends an HTTP GET request to the `/ready` endpoint of the service URL returned
-        by `get_service_url()`.
+        Sends an asynchronous HTTP GET request to the `/ready` endpoint of the service URL
+        returned by `get_service_url()`.
 
         The readiness endpoint should return a JSON object like:
 
@@ -168,10 +334,9 @@ class DeploymentPlatform(ABC):
             communicate their ready state.
         """
         try:
-            url = self.get_service_url(group_name)
-            readiness_url = f"{url.rstrip('/')}/ready"
-            logger.debug(f"[DeploymentPlatform] check readiness of group {group_name}: {readiness_url}")
-            response = httpx.get(readiness_url, timeout=2.0)
+            readiness_url = self._get_readiness_url(group_name)
+            logger.debug("[DeploymentPlatform] check readiness of group %s: %s", group_name, readiness_url)
+            response = await self.http_client.get(readiness_url, timeout=2.0)
             if response.status_code == 404:
                 return False, "Service does not expose a /ready endpoint (404 Not Found)"
             if response.status_code != 200:
@@ -192,11 +357,25 @@ class DeploymentPlatform(ABC):
         except Exception as e:
             return False, f"Unexpected error while checking readiness: {e}"
 
+    async def check_services_ready(self, group_names: Iterable[str]) -> Dict[str, Tuple[bool, str]]:
+        """
+        Check the readiness of the services of several groups concurrently.
+
+        Args:
+            group_names (Iterable[str]): The names of the groups.
+
+        Returns:
+            Dict: A dictionary mapping each group name to the result of `check_service_ready()`.
+        """
+        group_names = list(group_names)
+        results = await asyncio.gather(*(self.check_service_ready(group) for group in group_names))
+        return dict(zip(group_names, results))
+
     def _get_host_port(self, group_name: str) -> int:
         """
         Compute the host port to bind to this group in 'local' mode.
 
-        Uses a hash-based offset to reduce conflicts.
+        Uses a hash-based (CRC32) offset to reduce conflicts.
 
         Args:
             group_name (str): Group name used to derive the port.
@@ -204,9 +383,7 @@ class DeploymentPlatform(ABC):
         Returns:
             int: Host port to bind.
         """
-        base = settings.fastapi_group_host_port_base
-        h = int(hashlib.md5(group_name.encode()).hexdigest(), 16)
-        return base + (h % 1000)  # Allows for up to 1000 unique ports
+        return _compute_host_port(group_name, FASTAPI_GROUP_HOST_PORT_BASE)
 
     @abstractmethod
     def deploy_state_api(self) -> None:
@@ -30,7 +30,9 @@ Notes:
 """
 
 import re
+import threading
 import docker
+from typing import Dict, Optional, Set, Tuple
 import docker.errors
 from routing_layer.app.config import settings
 from routing_layer.app.core.logger import get_logger
@@ -38,6 +40,8 @@ from routing_layer.app.core.controller.deployment_platform import DeploymentPlat
 
 logger = get_logger(__name__)
 
+_GROUP_NAME_RE = re.compile(r"[^a-z0-9]+")
+
 
 class DockerDeploymentPlatform(DeploymentPlatform):
     """
@@ -45,23 +49,138 @@ class DockerDeploymentPlatform(DeploymentPlatform):
 
     Spawns FastAPI services for each group using local Docker containers.
     Suitable for local dev/testing environments without Docker Swarm.
+
+    Note:
+        A single Docker client (and its connection pool) is shared by all instances
+        of the platform for the lifetime of the process.
     """
 
+    GROUP_CONTAINER_PREFIX = "stream-api-group-"
+    ROUTING_LAYER_CONTAINER_NAME = "serving-layer-router"
+    STATE_API_CONTAINER_NAME = "openfactory-state-api"
+    # Grace period (in seconds) given to the routing layer and State API containers on removal
+    STOP_TIMEOUT = 2
+    # CFS scheduler period (in microseconds) used to express the CPU limits of the containers
+    CPU_PERIOD = 100000
+
+    _shared_client: Optional[docker.DockerClient] = None
+    _shared_client_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """ Initialize the platform, its group → container name cache and the static container settings. """
+        super().__init__()
+        self._name_cache: Dict[str, str] = {}
+        self._existing: Set[str] = set()
+        self._is_local = settings.environment == "local"
+        self._group_env_base = {
+            "KAFKA_BROKER": settings.kafka_broker,
+            "DEPLOYMENT_PLATFORM": "docker"
+        }
+        self._router_env = {
+            "KSQLDB_URL": settings.ksqldb_url,
+            "KAFKA_BROKER": settings.kafka_broker,
+            "KSQLDB_ASSETS_STREAM": settings.ksqldb_assets_stream,
+            "KSQLDB_UNS_MAP": settings.ksqldb_uns_map,
+            "LOG_LEVEL": settings.log_level,
+            "ENVIRONMENT": "production",
+            "DEPLOYMENT_PLATFORM": "docker"
+        }
+        self._cpu_quotas = {
+            "group": int(self.CPU_PERIOD * settings.fastapi_group_cpus_limit),
+            "router": int(self.CPU_PERIOD * settings.routing_layer_cpus_limit),
+            "state": int(self.CPU_PERIOD * settings.state_api_cpus_limit),
+        }
+        self._state_env = {
+            "KSQLDB_URL": settings.ksqldb_url,
+            "KSQLDB_ASSETS_TABLE": settings.ksqldb_assets_table,
+            "LOG_LEVEL": settings.log_level,
+            "DEPLOYMENT_PLATFORM": "docker"
+        }
+
+    @classmethod
+    def _get_shared_client(cls) -> Tuple[docker.DockerClient, bool]:
+        """
+        Return the process-wide Docker client, creating it on first use.
+
+        Returns:
+            Tuple: The shared Docker client, and True if it was created by this call.
+        """
+        with cls._shared_client_lock:
+            if cls._shared_client is not None:
+                return cls._shared_client, False
+            cls._shared_client = docker.from_env(max_pool_size=20)
+            return cls._shared_client, True
+
     def initialize(self) -> None:
         """
         Initializes the Docker client and checks connectivity.
+
+        Connectivity is only checked when the shared Docker client is first created.
+        The names of the containers managed by the platform are then loaded in a single call,
+        so that deploy and remove methods check for existing containers without a Docker API
+        call (and without handling `docker.errors.NotFound`).
         """
-        self.docker_client = docker.from_env()
-        try:
-            self.docker_client.ping()
-        except Exception as e:
-            raise RuntimeError(f"Docker Engine unreachable: {str(e)}")
+        self.docker_client, created = self._get_shared_client()
+        if created:
+            try:
+                self.docker_client.ping()
+            except Exception as e:
+                with self._shared_client_lock:
+                    DockerDeploymentPlatform._shared_client = None
+                raise RuntimeError(f"Docker Engine unreachable: {str(e)}")
+        self._load_existing_containers()
+
+    def _load_existing_containers(self) -> None:
+        """ Fetch the names of all existing containers managed by the platform in one Docker API call. """
+        containers = self.docker_client.containers.list(all=True, filters={"name": [
+            self.GROUP_CONTAINER_PREFIX,
+            self.ROUTING_LAYER_CONTAINER_NAME,
+            self.STATE_API_CONTAINER_NAME,
+        ]})
+        self._existing = {c.name for c in containers}
 
     def _sanitize_group_name(self, group_name: str) -> str:
-        return re.sub(r"[^a-z0-9]+", "-", group_name.lower()).strip("-")
+        return _GROUP_NAME_RE.sub("-", group_name.lower()).strip("-")
 
     def _container_name(self, group_name: str) -> str:
-        return f"stream-api-group-{self._sanitize_group_name(group_name)}"
+        name = self._name_cache.get(group_name)
+        if name is None:
+            name = f"{self.GROUP_CONTAINER_PREFIX}{self._sanitize_group_name(group_name)}"
+            self._name_cache[group_name] = name
+        return name
+
+    def _run_container(self, image: str, name: str, ports: Dict[str, int],
+                       environment: Dict[str, str], cpu_quota: int) -> None:
+        """
+        Create and start a detached container through the low-level Docker API.
+
+        Unlike `containers.run()`, no `Container` model is built, which saves the
+        extra inspect round-trip done after the container creation.
+
+        Args:
+            image (str): Image to run.
+            name (str): Container name.
+            ports (Dict[str, int]): Port bindings (e.g., {"5555/tcp": 5555}).
+            environment (Dict[str, str]): Environment variables.
+            cpu_quota (int): CPU quota in microseconds per `CPU_PERIOD`.
+        """
+        api = self.docker_client.api
+        host_config = api.create_host_config(
+            port_bindings=ports or None,
+            network_mode=settings.docker_network,
+            cpu_quota=cpu_quota,
+            cpu_period=self.CPU_PERIOD,
+        )
+        container = api.create_container(
+            image=image,
+            name=name,
+            detach=True,
+            ports=[tuple(port.split("/", 1)) for port in ports],
+            environment=environment,
+            host_config=host_config,
+            networking_config=api.create_networking_config({settings.docker_network: None}),
+        )
+        api.start(container["Id"])
 
     def deploy_service(self, group_name: str) -> None:
         """
@@ -73,37 +192,31 @@ class DockerDeploymentPlatform(DeploymentPlatform):
         container_name = self._container_name(group_name)
 
         # Check if container already exists
-        try:
-            self.docker_client.containers.get(container_name)
+        if container_name in self._existing:
             logger.info(f"🔄 Docker container for group '{group_name}' already running.")
             return
-        except docker.errors.NotFound:
-            pass
 
         logger.info(f"🚀 Starting Docker container for group '{group_name}'")
 
         ports = {}
-        if settings.environment == "local":
+        if self._is_local:
             ports = {"5555/tcp": self._get_host_port(group_name)}
 
         env_vars = {
-            "KAFKA_BROKER": settings.kafka_broker,
+            **self._group_env_base,
             "KAFKA_TOPIC": f"asset_stream_{group_name}_topic",
             "KAFKA_CONSUMER_GROUP_ID": f"asset_stream_{group_name}_consumer_group",
-            "DEPLOYMENT_PLATFORM": "docker"
         }
 
         try:
-            self.docker_client.containers.run(
+            self._run_container(
                 image=settings.fastapi_group_image,
                 name=container_name,
-                detach=True,
-                network=settings.docker_network,
                 ports=ports,
                 environment=env_vars,
-                cpu_quota=int(100000 * settings.fastapi_group_cpus_limit),  # microseconds/100ms
-                cpu_period=100000,
+                cpu_quota=self._cpu_quotas["group"],
             )
+            self._existing.add(container_name)
         except docker.errors.APIError as e:
             logger.error(f"💥 Docker error launching group '{group_name}': {e}")
 
@@ -111,68 +224,65 @@ class DockerDeploymentPlatform(DeploymentPlatform):
         """
         Remove a running group-specific container.
 
+        The container is force-removed (killed and deleted) in a single Docker API call,
+        without waiting for the default stop timeout.
+
         Args:
             group_name (str): Group to remove.
         """
         container_name = self._container_name(group_name)
         logger.info(f" Removing Docker container for group '{group_name}'")
+        if container_name not in self._existing:
+            logger.warning(f"⚠️  Container '{container_name}' not found.")
+            self._name_cache.pop(group_name, None)
+            return
         try:
-            container = self.docker_client.containers.get(container_name)
-            container.stop()
-            container.remove()
+            self.docker_client.api.remove_container(container_name, force=True)
+            self._existing.discard(container_name)
         except docker.errors.NotFound:
             logger.warning(f"⚠️  Container '{container_name}' not found.")
         except docker.errors.APIError as e:
             logger.error(f"💥 Docker error removing container: {e}")
+        self._name_cache.pop(group_name, None)
 
     def deploy_routing_layer_api(self) -> None:
         """
         Deploy the central routing layer API as a Docker container.
         """
-        container_name = "serving-layer-router"
+        container_name = self.ROUTING_LAYER_CONTAINER_NAME
 
-        try:
-            self.docker_client.containers.get(container_name)
+        if container_name in self._existing:
             logger.info("✅ Routing layer API already running.")
             return
-        except docker.errors.NotFound:
-            pass
 
         logger.info("🚀 Deploying routing layer API")
 
-        env_vars = {
-            "KSQLDB_URL": settings.ksqldb_url,
-            "KAFKA_BROKER": settings.kafka_broker,
-            "KSQLDB_ASSETS_STREAM": settings.ksqldb_assets_stream,
-            "KSQLDB_UNS_MAP": settings.ksqldb_uns_map,
-            "LOG_LEVEL": settings.log_level,
-            "ENVIRONMENT": "production",
-            "DEPLOYMENT_PLATFORM": "docker"
-        }
-
         try:
-            self.docker_client.containers.run(
+            self._run_container(
                 image=settings.routing_layer_image,
                 name=container_name,
-                detach=True,
-                network=settings.docker_network,
                 ports={"5555/tcp": 5555},
-                environment=env_vars,
-                cpu_quota=int(100000 * settings.routing_layer_cpus_limit),
-                cpu_period=100000,
+                environment=self._router_env,
+                cpu_quota=self._cpu_quotas["router"],
             )
+            self._existing.add(container_name)
         except docker.errors.APIError as e:
             logger.error(f"💥 Docker error launching routing layer API: {e}")
 
     def remove_routing_layer_api(self) -> None:
         """
         Remove the routing layer API container.
+
+        The container is given `STOP_TIMEOUT` seconds to shut down gracefully before being force-removed.
         """
         logger.info("Removing routing layer API container")
+        if self.ROUTING_LAYER_CONTAINER_NAME not in self._existing:
+            logger.warning("⚠️  Routing layer API container not found.")
+            return
         try:
-            container = self.docker_client.containers.get("serving-layer-router")
-            container.stop()
-            container.remove()
+            self.docker_client.api.stop(self.ROUTING_LAYER_CONTAINER_NAME, timeout=self.STOP_TIMEOUT)
+            self.docker_client.api.remove_container(self.ROUTING_LAYER_CONTAINER_NAME, force=True)
+            self._existing.discard(self.ROUTING_LAYER_CONTAINER_NAME)
         except docker.errors.NotFound:
             logger.warning("⚠️  Routing layer API container not found.")
         except docker.errors.APIError as e:
@@ -188,7 +298,7 @@ class DockerDeploymentPlatform(DeploymentPlatform):
         Returns:
             str: URL like http://localhost:<port>
         """
-        if settings.environment == "local":
+        if self._is_local:
             return f"http://localhost:{self._get_host_port(group_name)}"
         return f"http://{self._container_name(group_name)}:5555"
 
@@ -196,49 +306,42 @@ class DockerDeploymentPlatform(DeploymentPlatform):
         """
         Deploy the centralized State API as a Docker container.
         """
-        container_name = "openfactory-state-api"
+        container_name = self.STATE_API_CONTAINER_NAME
 
-        try:
-            self.docker_client.containers.get(container_name)
+        if container_name in self._existing:
             logger.info("✅ State API already running.")
             return
-        except docker.errors.NotFound:
-            pass
 
         logger.info("🚀 Deploying State API container")
 
-        env_vars = {
-            "KSQLDB_URL": settings.ksqldb_url,
-            "KSQLDB_ASSETS_TABLE": settings.ksqldb_assets_table,
-            "LOG_LEVEL": settings.log_level,
-            "DEPLOYMENT_PLATFORM": "docker"
-        }
-
-        ports = {"5555/tcp": 5556} if settings.environment == "local" else {}
+        ports = {"5555/tcp": 5556} if self._is_local else {}
 
         try:
-            self.docker_client.containers.run(
+            self._run_container(
                 image=settings.state_api_image,
                 name=container_name,
-                detach=True,
-                network=settings.docker_network,
                 ports=ports,
-                environment=env_vars,
-                cpu_quota=int(100000 * settings.state_api_cpus_limit),
-                cpu_period=100000,
+                environment=self._state_env,
+                cpu_quota=self._cpu_quotas["state"],
             )
+            self._existing.add(container_name)
         except docker.errors.APIError as e:
             logger.error(f"💥 Docker error launching State API: {e}")
 
     def remove_state_api(self) -> None:
         """
         Remove the State API Docker container.
+
+        The container is given `STOP_TIMEOUT` seconds to shut down gracefully before being force-removed.
         """
         logger.info("Removing State API container")
+        if self.STATE_API_CONTAINER_NAME not in self._existing:
+            logger.warning("⚠️  State API container not found.")
+            return
         try:
-            container = self.docker_client.containers.get("openfactory-state-api")
-            container.stop()
-            container.remove()
+            self.docker_client.api.stop(self.STATE_API_CONTAINER_NAME, timeout=self.STOP_TIMEOUT)
+            self.docker_client.api.remove_container(self.STATE_API_CONTAINER_NAME, force=True)
+            self._existing.discard(self.STATE_API_CONTAINER_NAME)
         except docker.errors.NotFound:
             logger.warning("⚠️  State API container not found.")
         except docker.errors.APIError as e:
@@ -251,7 +354,7 @@ class DockerDeploymentPlatform(DeploymentPlatform):
         Returns:
             str: URL like http://localhost:5555 or internal Docker network address.
         """
-        if settings.environment == "local":
+        if self._is_local:
             logger.info("Using local override for State API URL")
             return "http://localhost:5556"
-        return "http://openfactory-state-api:5555"
+        return f"http://{self.STATE_API_CONTAINER_NAME}:5555"
@@ -98,6 +98,23 @@ class GroupingStrategy(ABC):
         """
         raise NotImplementedError("create_derived_stream must be implemented by subclasses.")
 
+    def create_derived_streams_batch(self, group_names: List[str]) -> None:
+        """
+        Create or ensure that derived streams exist for several groups.
+
+        The default implementation calls `create_derived_stream()` for each group.
+        Subclasses backed by a service accepting multiple statements per request
+        (e.g., ksqlDB) should override it to create all streams in a single round-trip.
+
+        Args:
+            group_names (List[str]): The names of the groups for which to create the derived streams.
+
+        Returns:
+            None
+        """
+        for group_name in group_names:
+            self.create_derived_stream(group_name)
+
     @abstractmethod
     def remove_derived_stream(self, group_name: str) -> None:
         """
@@ -9,8 +9,13 @@ grouping strategies and deployment platforms. It is responsible for:
 - Handling incoming client requests and routing them to the appropriate group service
 """
 
+import asyncio
+import time
 import httpx
-from typing import Optional, Tuple, Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple, Dict, List
 from routing_layer.app.core.logger import get_logger
 from routing_layer.app.config import settings
 from routing_layer.app.core.utils import load_plugin
@@ -19,6 +24,34 @@ from routing_layer.app.core.controller.deployment_platform import DeploymentPlat
 
 logger = get_logger(__name__)
 
+# Values returned by the grouping strategy when an asset has no usable group
+INVALID_GROUPS = frozenset({None, '', 'UNAVAILABLE'})
+
+
+@lru_cache(maxsize=None)
+def _load_checked_plugin(group: str, name: str, base: type) -> type:
+    """
+    Load a plugin class from entry points and verify that it subclasses the expected interface.
+
+    The result is cached per (group, name, base): plugins are considered immutable
+    for the lifetime of the process.
+
+    Args:
+        group (str): Entry point group name.
+        name (str): Name of the registered plugin.
+        base (type): Interface the plugin class must inherit from.
+
+    Returns:
+        type: The loaded plugin class.
+
+    Raises:
+        TypeError: If the loaded class does not subclass `base`.
+    """
+    plugin_cls = load_plugin(group, name)
+    if not issubclass(plugin_cls, base):
+        raise TypeError(f"Plugin '{name}' does not inherit from {base.__name__}")
+    return plugin_cls
+
 
 class RoutingController:
     """
@@ -28,8 +61,23 @@ class RoutingController:
     - Create group-specific Kafka streams
     - Deploy corresponding FastAPI services
     - Dynamically route client requests to the appropriate group
+
+    Resolved routes (asset UUID → group service URL) are cached for `ROUTE_CACHE_TTL`
+    seconds. Unresolved routes are cached for the shorter `ROUTE_CACHE_NEGATIVE_TTL`
+    so that unknown assets do not trigger a lookup on every request. Once the cache
+    holds `ROUTE_CACHE_MAXSIZE` routes, the least recently used ones are evicted.
+
+    Streams and services are deployed or removed by separate CLI processes, so in the
+    API server the route cache is only bounded by its TTL, plus `evict_route` when the
+    stream proxy fails to reach a cached group service.
     """
 
+    ROUTE_CACHE_TTL = 10.0
+    ROUTE_CACHE_NEGATIVE_TTL = 2.0
+    ROUTE_CACHE_MAXSIZE = 65536
+    GROUP_WORKERS = 10
+    GROUPS_CACHE_TTL = 5.0
+
     def __init__(self) -> None:
         """
         Initialize the RoutingController using plugin-based configuration.
@@ -43,71 +91,217 @@ class RoutingController:
         - `openfactory_routing_layer.grouping_strategies`
         - `openfactory_routing_layer.deployment_platforms`
 
+        Plugin classes are resolved once per process and reused by later controller instances.
+
         Raises:
-            ValueError: If no matching plugin is found, or if the loaded class does not
-                        subclass the expected interface.
+            ValueError: If no matching plugin is found.
+            TypeError: If the loaded class does not subclass the expected interface.
         """
-        strategy_cls = load_plugin("openfactory_routing_layer.grouping_strategies", settings.grouping_strategy)
-        platform_cls = load_plugin("openfactory_routing_layer.deployment_platforms", settings.deployment_platform)
-
-        if not issubclass(strategy_cls, GroupingStrategy):
-            raise TypeError(
-                f"Plugin '{settings.grouping_strategy}' does not inherit from GroupingStrategy"
-            )
-
-        if not issubclass(platform_cls, DeploymentPlatform):
-            raise TypeError(
-                f"Plugin '{settings.deployment_platform}' does not inherit from DeploymentPlatform"
-            )
+        strategy_cls = _load_checked_plugin(
+            "openfactory_routing_layer.grouping_strategies", settings.grouping_strategy, GroupingStrategy
+        )
+        platform_cls = _load_checked_plugin(
+            "openfactory_routing_layer.deployment_platforms", settings.deployment_platform, DeploymentPlatform
+        )
 
         self.grouping_strategy = strategy_cls()
         self.deployment_platform = platform_cls()
+        self._is_local = settings.environment == 'local'
+        self._platform_initialized = False
+        self._groups_cache: Optional[Tuple[List[str], float]] = None
+        self._route_cache: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        self._reset_state_api_urls()
+
+    def _reset_state_api_urls(self) -> None:
+        """ Drop the cached State API URLs so that they are resolved again on next access. """
+        self._state_api_url_cache: Optional[str] = None
+        self._state_api_asset_state_url: Optional[str] = None
+        self._state_api_ready_url: Optional[str] = None
+
+    def invalidate_state_api_url(self) -> None:
+        """
+        Drop the cached State API URLs so that they are resolved again through the deployment platform.
+
+        Called by the State API proxy when the cached URL cannot be connected to.
+        """
+        self._reset_state_api_urls()
+
+    def _resolve_state_api_urls(self) -> None:
+        """ Resolve the State API base URL once and precompute the endpoint URLs derived from it. """
+        url = self.deployment_platform.get_state_api_url()
+        if not url:
+            return
+        base_url = url.rstrip('/')
+        self._state_api_url_cache = base_url
+        self._state_api_asset_state_url = f"{base_url}/asset_state"
+        self._state_api_ready_url = f"{base_url}/ready"
+
+    @property
+    def state_api_url(self) -> Optional[str]:
+        """
+        URL of the State API, resolved once through the deployment platform and then cached.
+
+        The State API is deployed and removed by separate CLI processes, so in the API server
+        the cached value is only reset through `invalidate_state_api_url`, when the State API
+        proxy fails to connect to it.
+
+        Returns:
+            Optional[str]: The resolved URL of the State API service (without trailing slash).
+        """
+        if self._state_api_url_cache is None:
+            self._resolve_state_api_urls()
+        return self._state_api_url_cache
+
+    @property
+    def state_api_asset_state_url(self) -> Optional[str]:
+        """
+        Precomputed URL of the State API `/asset_state` endpoint.
+
+        Returns:
+            Optional[str]: The endpoint URL, or None if the State API URL could not be resolved.
+        """
+        if self._state_api_url_cache is None:
+            self._resolve_state_api_urls()
+        return self._state_api_asset_state_url
+
+    def use_http_client(self, client: httpx.AsyncClient) -> None:
+        """
+        Share an application-wide HTTP client with the deployment platform for readiness probes.
+
+        Args:
+            client (httpx.AsyncClient): The shared client (owned and closed by the caller).
+        """
+        self.deployment_platform.use_http_client(client)
+
+    async def aclose(self) -> None:
+        """ Release the HTTP resources held for readiness probes. """
+        await self.deployment_platform.aclose()
+
+    def _initialize_platform(self) -> None:
+        """ Initialize the deployment platform once for the lifetime of the controller. """
+        if not self._platform_initialized:
+            self.deployment_platform.initialize()
+            self._platform_initialized = True
+
+    def invalidate_route_cache(self) -> None:
+        """
+        Drop all cached asset UUID → service URL routes and the cached group list.
+
+        Only affects the caches of this controller instance (e.g. the deploy/teardown
+        CLI process), not those of a running API server.
+        """
+        self._route_cache.clear()
+        self._groups_cache = None
+
+    def evict_route(self, asset_uuid: str) -> None:
+        """
+        Drop the cached route of an asset so that it is resolved again on the next request.
+
+        Called by the stream proxy when the cached group service cannot be reached.
+
+        Args:
+            asset_uuid (str): The UUID of the asset whose route is evicted.
+        """
+        if self._route_cache.pop(asset_uuid, None) is not None:
+            logger.debug("[controller] Evicted cached route of asset %s", asset_uuid)
+
+    def _tear_down_group_stream(self, group: str) -> None:
+        """
+        Remove the derived stream of a group.
+
+        Args:
+            group (str): The name of the group.
+        """
+        logger.info(f"  Tearing down group [{group}]")
+        self.grouping_strategy.remove_derived_stream(group)
 
     def _initialize(self) -> None:
         """
         Initialize the routing layer by creating streams and deploying services
         for all currently known groups.
+
+        The derived streams of all groups are created in one batch, then the group
+        services are deployed in bulk by the deployment platform.
         """
         logger.info("Initializing Routing Layer...")
-        self.deployment_platform.initialize()
+        self._initialize_platform()
         logger.info("Setting up groups...")
-        for group in self.grouping_strategy.get_all_groups():
-            logger.info(f"Spin up group [{group}]")
-            self.grouping_strategy.create_derived_stream(group)
-            self.deployment_platform.deploy_service(group)
-        if self.grouping_strategy.get_all_groups() == []:
+        groups = self.grouping_strategy.get_all_groups()
+        self.grouping_strategy.create_derived_streams_batch(groups)
+        self.invalidate_route_cache()
+        logger.info(f"Spin up groups [{', '.join(groups)}]")
+        self.deployment_platform.deploy_services(groups)
+        if not groups:
             logger.info("⚠️  Warning: No groups setup")
         logger.info("Spin up State-API")
         self.deployment_platform.deploy_state_api()
+        self._reset_state_api_urls()
         logger.info("✅ Routing Layer initialization complete.")
 
     def deploy(self) -> None:
         """  Deploy the OpenFactory routing layer API. """
         self._initialize()
-        if settings.environment != 'local':
+        if not self._is_local:
             self.deployment_platform.deploy_routing_layer_api()
             logger.info("✅ Routing Layer API deployement complete.")
 
     def teardown(self) -> None:
         """
         Tear down the routing layer by removing all group-specific streams and services.
+
+        The derived streams of the groups are removed concurrently by up to `GROUP_WORKERS`
+        threads, then the group services are removed in bulk by the deployment platform.
         """
         logger.info("Stopping Routing Layer...")
-        self.deployment_platform.initialize()
-        for group in self.grouping_strategy.get_all_groups():
-            logger.info(f"  Tearing down group [{group}]")
-            self.grouping_strategy.remove_derived_stream(group)
-            self.deployment_platform.remove_service(group)
+        self._initialize_platform()
+        groups = self.grouping_strategy.get_all_groups()
+        with ThreadPoolExecutor(max_workers=self.GROUP_WORKERS) as executor:
+            list(executor.map(self._tear_down_group_stream, groups))
+        self.invalidate_route_cache()
+        self.deployment_platform.remove_services(groups)
         logger.info("  Tearing State-API")
         self.deployment_platform.remove_state_api()
-        if settings.environment != 'local':
+        self._reset_state_api_urls()
+        if not self._is_local:
             self.deployment_platform.remove_routing_layer_api()
+        self.deployment_platform.close()
+        self._platform_initialized = False
         logger.info("✅ Routing Layer removal complete.")
 
     def handle_client_request(self, asset_uuid: str) -> Optional[str]:
         """
         Determine the group for a given asset UUID and return the corresponding service URL.
 
+        Args:
+            asset_uuid (str): The UUID of the asset making the request.
+
+        Returns:
+            Optional[str]: The service URL for the group, or None if the group could not be resolved.
+
+        Note:
+            Results are served from a TTL-bounded LRU cache; see `ROUTE_CACHE_TTL`,
+            `ROUTE_CACHE_NEGATIVE_TTL` and `ROUTE_CACHE_MAXSIZE`. A route is dropped before
+            its TTL expires only through `evict_route`, on upstream proxy failure.
+        """
+        now = time.monotonic()
+        cached = self._route_cache.get(asset_uuid)
+        if cached is not None and cached[1] > now:
+            self._route_cache.move_to_end(asset_uuid)
+            return cached[0]
+
+        url = self._resolve_service_url(asset_uuid)
+        ttl = self.ROUTE_CACHE_TTL if url else self.ROUTE_CACHE_NEGATIVE_TTL
+
+        self._route_cache[asset_uuid] = (url, now + ttl)
+        self._route_cache.move_to_end(asset_uuid)
+        while len(self._route_cache) > self.ROUTE_CACHE_MAXSIZE:
+            self._route_cache.popitem(last=False)
+        return url
+
+    def _resolve_service_url(self, asset_uuid: str) -> Optional[str]:
+        """
+        Resolve the service URL for a given asset UUID without caching.
+
         Args:
             asset_uuid (str): The UUID of the asset making the request.
 
@@ -115,14 +309,50 @@ class RoutingController:
             Optional[str]: The service URL for the group, or None if the group could not be resolved.
         """
         group = self.grouping_strategy.get_group_for_asset(asset_uuid)
-        if not group or group == 'UNAVAILABLE':
+        if group in INVALID_GROUPS:
             logger.warning(f"[controller] Could not determine group for asset {asset_uuid}")
             return None
 
-        logger.debug(f"[controller] Asset {asset_uuid} is in group '{group}'")
+        logger.debug("[controller] Asset %s is in group '%s'", asset_uuid, group)
         return self.deployment_platform.get_service_url(group)
 
-    def is_ready(self) -> Tuple[bool, Dict[str, str]]:
+    def _get_groups_cached(self) -> List[str]:
+        """
+        Return all known groups, reusing the last result for `GROUPS_CACHE_TTL` seconds.
+
+        Absorbs bursts of readiness probes without querying the grouping backend each time.
+
+        Returns:
+            List[str]: A list of group names.
+        """
+        now = time.monotonic()
+        if self._groups_cache is not None and self._groups_cache[1] > now:
+            return self._groups_cache[0]
+        groups = self.grouping_strategy.get_all_groups()
+        self._groups_cache = (groups, now + self.GROUPS_CACHE_TTL)
+        return groups
+
+    async def _check_state_api_ready(self) -> Optional[str]:
+        """
+        Probe the `/ready` endpoint of the State API.
+
+        Returns:
+            Optional[str]: A diagnostic message if the State API is not ready, None otherwise.
+        """
+        state_url = self.state_api_url
+        try:
+            response = await self.deployment_platform.http_client.get(self._state_api_ready_url, timeout=2.0)
+            if response.status_code == 404:
+                return "No /ready endpoint defined"
+            if response.status_code != 200:
+                return f"Status code {response.status_code}"
+            if response.json().get("status") != "ready":
+                return "Reported not ready"
+            return None
+        except Exception as e:
+            return f"{state_url} not reachable: {e}"
+
+    async def is_ready(self) -> Tuple[bool, Dict[str, str]]:
         """
         Check the readiness status of the routing controller and its subcomponents.
 
@@ -130,6 +360,8 @@ class RoutingController:
         by checking both the grouping strategy and the deployment platform. Each subcomponent's
         readiness is determined by calling its own `is_ready()` method, which returns a tuple
         of (bool, str) — indicating readiness and an optional diagnostic message.
+        The grouping strategy check and the readiness probes of the deployed group services
+        and of the State API run concurrently.
 
         Returns:
             Tuple: A tuple where the first element is a boolean indicating
@@ -147,29 +379,22 @@ class RoutingController:
         """
         issues = {}
 
-        grouping_ready, grouping_msg = self.grouping_strategy.is_ready()
+        # Probe the grouping backend, the deployed services and the State API concurrently
+        groups = await asyncio.to_thread(self._get_groups_cached)
+        (grouping_ready, grouping_msg), services, state_api_issue = await asyncio.gather(
+            asyncio.to_thread(self.grouping_strategy.is_ready),
+            self.deployment_platform.check_services_ready(groups),
+            self._check_state_api_ready()
+        )
+
         if not grouping_ready:
             issues["grouping_strategy"] = grouping_msg
 
-        # Check readiness status of deployed services
-        for group in self.grouping_strategy.get_all_groups():
-            healthy, msg = self.deployment_platform.check_service_ready(group)
+        for group, (healthy, msg) in services.items():
             if not healthy:
                 issues[f"service:{group}"] = msg
 
-        # Check readiness status of state API
-        state_url = self.deployment_platform.get_state_api_url()
-        try:
-            response = httpx.get(f"{state_url.rstrip('/')}/ready", timeout=2.0)
-            if response.status_code == 404:
-                issues["state_api"] = "No /ready endpoint defined"
-            elif response.status_code != 200:
-                issues["state_api"] = f"Status code {response.status_code}"
-            else:
-                data = response.json()
-                if data.get("status") != "ready":
-                    issues["state_api"] = "Reported not ready"
-        except Exception as e:
-            issues["state_api"] = f"{state_url} not reachable: {e}"
+        if state_api_issue:
+            issues["state_api"] = state_api_issue
 
         return (len(issues) == 0, issues)
@@ -30,10 +30,14 @@ Note:
       group name to maintain uniqueness and DNS-safe formatting.
 """
 
-import re
+import threading
+import time
 import docker
 import docker.errors
+from concurrent.futures import ThreadPoolExecutor
 from docker.types import EndpointSpec
+from typing import Dict, Iterable, Optional, Tuple
+from docker.models.services import Service
 from routing_layer.app.config import settings
 from routing_layer.app.core.logger import get_logger
 from routing_layer.app.core.controller.deployment_platform import DeploymentPlatform
@@ -41,6 +45,9 @@ from routing_layer.app.core.controller.deployment_platform import DeploymentPlat
 
 logger = get_logger(__name__)
 
+# Byte translation table keeping [a-z0-9] and mapping every other byte to a dash
+_SANITIZE_TABLE = bytes(c if (0x61 <= c <= 0x7a or 0x30 <= c <= 0x39) else 0x2d for c in range(256))
+
 
 class SwarmDeploymentPlatform(DeploymentPlatform):
     """
@@ -54,9 +61,110 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
           API runs locally, while group services run inside the Swarm cluster.
         - Validates Swarm manager role and connectivity during initialization if
           `docker_client` is provided.
+        - A single Docker client (and its connection pool) is shared by all instances
+          of the platform until `close()` is called.
     """
 
+    GROUP_SERVICE_PREFIX = "stream-api-group-"
     STATE_API_SERVICE_NAME = "openfactory-state-api"
+    ROUTING_LAYER_SERVICE_NAME = "serving_layer_router"
+    # Upper bound of concurrent service creations or removals in `deploy_services()` and `remove_services()`
+    MAX_CONTROL_WORKERS = 16
+    # Lifetime (in seconds) of the service inventory snapshot
+    SERVICE_INDEX_TTL = 30.0
+
+    _shared_client: Optional[docker.DockerClient] = None
+    _shared_client_lock = threading.Lock()
+
+    @classmethod
+    def _get_shared_client(cls) -> Tuple[docker.DockerClient, bool]:
+        """
+        Return the process-wide Docker client, creating it on first use.
+
+        Returns:
+            Tuple: The shared Docker client, and True if it was created by this call.
+        """
+        with cls._shared_client_lock:
+            if cls._shared_client is not None:
+                return cls._shared_client, False
+            cls._shared_client = docker.from_env(max_pool_size=32)
+            return cls._shared_client, True
+
+    def __init__(self) -> None:
+        """ Initialize the platform, its group → service name cache and its (empty) service inventory. """
+        super().__init__()
+        self._name_cache: Dict[str, str] = {}
+        self._url_cache: Dict[str, str] = {}
+        self._is_local = settings.environment == "local"
+        self._state_api_url = f"http://{self.STATE_API_SERVICE_NAME}:5555"
+        self._kafka_broker_env = f"KAFKA_BROKER={settings.kafka_broker}"
+        self._group_resources = {
+            "Limits": {"NanoCPUs": int(1000000000*settings.fastapi_group_cpus_limit)},
+            "Reservations": {"NanoCPUs": int(1000000000*settings.fastapi_group_cpus_reservation)}
+        }
+        self._service_index_cache: Optional[Dict[str, Service]] = None
+        self._service_index_ts = 0.0
+        # Guards the inventory, which is updated by the worker threads of bulk deploys/removals
+        self._service_index_lock = threading.Lock()
+
+    def _refresh_service_index(self, force: bool = False) -> Dict[str, Service]:
+        """
+        Return a name → service snapshot of the services deployed on the Swarm cluster.
+
+        The inventory is fetched with a single `services.list` call and reused for
+        `SERVICE_INDEX_TTL` seconds. Deploy and remove methods keep it up to date
+        through `_remember_service` and `_forget_service`.
+
+        Args:
+            force (bool): Fetch the inventory even if the snapshot has not expired.
+
+        Returns:
+            Dict[str, Service]: Deployed services by name.
+        """
+        with self._service_index_lock:
+            now = time.monotonic()
+            if force or self._service_index_cache is None or now - self._service_index_ts >= self.SERVICE_INDEX_TTL:
+                self._service_index_cache = {s.name: s for s in self.docker_client.services.list()}
+                self._service_index_ts = now
+            return self._service_index_cache
+
+    def _get_service(self, name: str) -> Service:
+        """
+        Return the handle of a deployed service, from the inventory if possible.
+
+        Args:
+            name (str): The service name.
+
+        Returns:
+            Service: The service handle.
+
+        Raises:
+            docker.errors.NotFound: If the service is not deployed.
+        """
+        service = self._refresh_service_index().get(name)
+        if service is None:
+            service = self.docker_client.services.get(name)
+        return service
+
+    def _remember_service(self, name: str, service: Service) -> None:
+        """ Add a created service to the inventory. """
+        with self._service_index_lock:
+            if self._service_index_cache is not None:
+                self._service_index_cache[name] = service
+
+    def _forget_service(self, name: str) -> None:
+        """ Drop a removed service from the inventory. """
+        with self._service_index_lock:
+            if self._service_index_cache is not None:
+                self._service_index_cache.pop(name, None)
+
+    @classmethod
+    def _discard_shared_client(cls) -> None:
+        """ Close and forget the process-wide Docker client. """
+        with cls._shared_client_lock:
+            if cls._shared_client is not None:
+                cls._shared_client.close()
+                cls._shared_client = None
 
     def initialize(self) -> None:
         """
@@ -75,13 +183,16 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
 
         Note:
             This method is intended to be called **only** during the deployment and teardown phases
-            by the `RoutingController`.
+            by the `RoutingController`. The checks only run when the shared Docker client is first created.
         """
-        self.docker_client = docker.from_env()
+        self.docker_client, created = self._get_shared_client()
+        if not created:
+            return
 
         try:
             self.docker_client.ping()
         except Exception as e:
+            self._discard_shared_client()
             raise RuntimeError(f"Docker Engine unreachable during init: {str(e)}")
 
         try:
@@ -96,8 +207,15 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
                 raise RuntimeError("Swarm manager required during init: This node is not a Swarm manager.")
 
         except Exception as e:
+            self._discard_shared_client()
             raise RuntimeError(f"Failed to verify Swarm configuration during init: {str(e)}")
 
+    def close(self) -> None:
+        """ Close the shared Docker client and its pooled connections. """
+        self._discard_shared_client()
+        with self._service_index_lock:
+            self._service_index_cache = None
+
     def _sanitize_group_name(self, group_name: str) -> str:
         """
         Sanitizes the group name to be a valid Docker Swarm service name component.
@@ -108,21 +226,27 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
         Returns:
             str: A sanitized, lowercase, dash-safe string suitable for service naming.
         """
-        sanitized = re.sub(r'[^a-z0-9]+', '-', group_name.lower())  # Replace non-alphanumerics with dash
-        return sanitized.strip('-')
+        # Non-ASCII characters become '?' and then a dash, like any other non-alphanumeric character
+        sanitized = group_name.lower().encode('ascii', 'replace').translate(_SANITIZE_TABLE).decode('ascii')
+        return '-'.join(filter(None, sanitized.split('-')))  # Collapse and strip dashes
 
     def _service_name(self, group_name: str) -> str:
         """
         Generate the Docker Swarm service name for a group.
 
+        The name is computed once per group and then served from a cache.
+
         Args:
             group_name (str): The name of the group.
 
         Returns:
             str: A sanitized Docker service name.
         """
-        safe_name = self._sanitize_group_name(group_name)
-        return f"stream-api-group-{safe_name}"
+        name = self._name_cache.get(group_name)
+        if name is None:
+            name = f"{self.GROUP_SERVICE_PREFIX}{self._sanitize_group_name(group_name)}"
+            self._name_cache[group_name] = name
+        return name
 
     def deploy_service(self, group_name: str) -> None:
         """
@@ -135,39 +259,82 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
             None
         """
         # check if service is alreay deployed
-        existing_services = self.docker_client.services.list(filters={"name": self._service_name(group_name)})
-        if existing_services:
+        if self._service_name(group_name) in self._refresh_service_index():
             logger.info(f" 🔄 Swarm service for group '{group_name}' already running.")
             return
 
+        try:
+            self._create_group_service(group_name)
+        except docker.errors.APIError as e:
+            logger.error(f"  Docker API error during deployment of group '{group_name}': {e}")
+
+    def deploy_services(self, group_names: Iterable[str]) -> None:
+        """
+        Deploy the Docker Swarm services of several groups.
+
+        Already deployed services are looked up in the service inventory, then the missing
+        services are created concurrently by up to `MAX_CONTROL_WORKERS` threads.
+
+        Args:
+            group_names (Iterable[str]): The names of the groups for which to deploy the services.
+        """
+        existing = self._refresh_service_index()
+        pending = []
+        for group_name in group_names:
+            if self._service_name(group_name) in existing:
+                logger.info(f" 🔄 Swarm service for group '{group_name}' already running.")
+            else:
+                pending.append(group_name)
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONTROL_WORKERS, len(pending))) as executor:
+            futures = {group_name: executor.submit(self._create_group_service, group_name) for group_name in pending}
+
+        failed = []
+        for group_name, future in futures.items():
+            error = future.exception()
+            if isinstance(error, docker.errors.APIError):
+                logger.error(f"  Docker API error during deployment of group '{group_name}': {error}")
+                failed.append(group_name)
+            elif error is not None:
+                raise error
+        if failed:
+            logger.error(f"  Failed to deploy {len(failed)} of {len(pending)} group services: {', '.join(failed)}")
+
+    def _create_group_service(self, group_name: str) -> None:
+        """
+        Create the Docker Swarm service of a group.
+
+        Args:
+            group_name (str): The name of the group.
+
+        Raises:
+            docker.errors.APIError: If the Docker API rejects the service creation.
+        """
         logger.info(f" 🚀 Deploying Swarm service for group '{group_name}' using image '{settings.fastapi_group_image}'")
 
         # Default endpoint spec (no published port)
         endpoint_spec = None
 
         # In local mode, publish port 5555 to host
-        if settings.environment == "local":
+        if self._is_local:
             endpoint_spec = EndpointSpec(
                 ports={self._get_host_port(group_name): 5555}  # host:container
             )
 
-        try:
-            self.docker_client.services.create(
-                image=settings.fastapi_group_image,
-                name=self._service_name(group_name),
-                networks=[settings.docker_network],
-                mode={"Replicated": {"Replicas": settings.fastapi_group_replicas}},
-                resources={
-                        "Limits": {"NanoCPUs": int(1000000000*settings.fastapi_group_cpus_limit)},
-                        "Reservations": {"NanoCPUs": int(1000000000*settings.fastapi_group_cpus_reservation)}
-                        },
-                env=[f'KAFKA_BROKER={settings.kafka_broker}',
-                     f'KAFKA_TOPIC=asset_stream_{group_name}_topic',
-                     f'KAFKA_CONSUMER_GROUP_ID=asset_stream_{group_name}_consumer_group'],
-                endpoint_spec=endpoint_spec
-            )
-        except docker.errors.APIError as e:
-            logger.error(f"  Docker API error during deployment of group '{group_name}': {e}")
+        service_name = self._service_name(group_name)
+        self._remember_service(service_name, self.docker_client.services.create(
+            image=settings.fastapi_group_image,
+            name=service_name,
+            networks=[settings.docker_network],
+            mode={"Replicated": {"Replicas": settings.fastapi_group_replicas}},
+            resources=self._group_resources,
+            env=[self._kafka_broker_env,
+                 f'KAFKA_TOPIC=asset_stream_{group_name}_topic',
+                 f'KAFKA_CONSUMER_GROUP_ID=asset_stream_{group_name}_consumer_group'],
+            endpoint_spec=endpoint_spec
+        ))
 
     def remove_service(self, group_name: str) -> None:
         """
@@ -177,27 +344,65 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
             group_name (str): The name of the group whose service should be removed.
         """
         logger.info(f"  Removing Swarm service for group '{group_name}'")
+        if self._remove_group_service(group_name) == "not_found":
+            logger.warning(f"  Swarm service for group '{group_name}' not deployed on OpenFactory Swarm cluster")
+
+    def remove_services(self, group_names: Iterable[str]) -> None:
+        """
+        Remove the Docker Swarm services of several groups.
+
+        The service inventory is refreshed once, then the services are removed concurrently
+        by up to `MAX_CONTROL_WORKERS` threads. A single summary line is logged.
+
+        Args:
+            group_names (Iterable[str]): The names of the groups whose services should be removed.
+        """
+        group_names = list(group_names)
+        if not group_names:
+            return
+        self._refresh_service_index(force=True)
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONTROL_WORKERS, len(group_names))) as executor:
+            outcomes = list(executor.map(self._remove_group_service, group_names))
+
+        logger.info(f"  Removed {outcomes.count('removed')} Swarm group services "
+                    f"({outcomes.count('not_found')} not deployed, {outcomes.count('error')} failed)")
+
+    def _remove_group_service(self, group_name: str) -> str:
+        """
+        Remove the Docker Swarm service of a group.
+
+        Args:
+            group_name (str): The name of the group.
+
+        Returns:
+            str: "removed", "not_found" or "error".
+        """
+        service_name = self._service_name(group_name)
+        self._url_cache.pop(group_name, None)
         try:
-            service = self.docker_client.services.get(self._service_name(group_name))
-            service.remove()
+            self._get_service(service_name).remove()
+            self._forget_service(service_name)
+            return "removed"
         except docker.errors.NotFound:
-            logger.warning(f"  Swarm service for group '{group_name}' not deployed on OpenFactory Swarm cluster")
+            self._forget_service(service_name)
+            return "not_found"
         except docker.errors.APIError as e:
-            logger.error(f"  Docker API error: {e}")
+            logger.error(f"  Docker API error while removing group '{group_name}': {e}")
+            return "error"
 
     def deploy_routing_layer_api(self) -> None:
         """ Deploy the central routing layer API service. """
 
-        existing_services = self.docker_client.services.list(filters={"name": 'serving_layer_router'})
-        if existing_services:
+        if self.ROUTING_LAYER_SERVICE_NAME in self._refresh_service_index():
             logger.info("🚀 Routing layer API already deployed on OpenFactory Swarm cluster")
             return
 
         logger.info("🚀 Deploying routing layer API on OpenFactory Swarm cluster")
         try:
-            self.docker_client.services.create(
+            self._remember_service(self.ROUTING_LAYER_SERVICE_NAME, self.docker_client.services.create(
                 image=settings.routing_layer_image,
-                name='serving_layer_router',
+                name=self.ROUTING_LAYER_SERVICE_NAME,
                 networks=[settings.docker_network],
                 mode={"Replicated": {"Replicas": settings.routing_layer_replicas}},
                 resources={
@@ -211,7 +416,7 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
                      f'LOG_LEVEL={settings.log_level}',
                      'ENVIRONMENT=production'],
                 endpoint_spec=EndpointSpec(ports={5555: 5555})
-            )
+            ))
         except docker.errors.APIError as e:
             logger.error(f"  Docker API error: {e}")
 
@@ -219,8 +424,8 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
         """ Remove the central routing layer API service. """
         logger.info("  Removing routing layer API from the OpenFactory Swarm cluster")
         try:
-            service = self.docker_client.services.get('serving_layer_router')
-            service.remove()
+            self._get_service(self.ROUTING_LAYER_SERVICE_NAME).remove()
+            self._forget_service(self.ROUTING_LAYER_SERVICE_NAME)
         except docker.errors.NotFound:
             logger.warning("  Routing layer API not deployed on OpenFactory Swarm cluster")
         except docker.errors.APIError as e:
@@ -231,6 +436,7 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
         Resolve the endpoint URL for a group service.
 
         In 'local' mode, maps to localhost; otherwise, uses internal Docker DNS.
+        The URL is computed once per group and then served from a cache.
 
         Args:
             group_name (str): The name of the group.
@@ -238,19 +444,22 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
         Returns:
             str: Resolved HTTP service endpoint.
         """
-        if settings.environment == "local":
-            logger.info("Using local override for target URL")
-            host_port = self._get_host_port(group_name)
-            return f"http://{settings.swarm_node_host}:{host_port}"
-        return f"http://{self._service_name(group_name)}:5555"
+        url = self._url_cache.get(group_name)
+        if url is None:
+            if self._is_local:
+                logger.info("Using local override for target URL")
+                url = f"http://{settings.swarm_node_host}:{self._get_host_port(group_name)}"
+            else:
+                url = f"http://{self._service_name(group_name)}:5555"
+            self._url_cache[group_name] = url
+        return url
 
     def deploy_state_api(self) -> None:
         """
         Deploy the centralized State API as a Docker service.
         """
 
-        existing_services = self.docker_client.services.list(filters={"name": self.STATE_API_SERVICE_NAME})
-        if existing_services:
+        if self.STATE_API_SERVICE_NAME in self._refresh_service_index():
             logger.info("🚀 State API already deployed on OpenFactory Swarm cluster")
             return
 
@@ -264,7 +473,7 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
         }
 
         try:
-            self.docker_client.services.create(
+            self._remember_service(self.STATE_API_SERVICE_NAME, self.docker_client.services.create(
                 name=self.STATE_API_SERVICE_NAME,
                 image=settings.state_api_image,
                 networks=[settings.docker_network],
@@ -273,7 +482,7 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
                         "Limits": {"NanoCPUs": int(1000000000*settings.state_api_cpus_limit)},
                         "Reservations": {"NanoCPUs": int(1000000000*settings.state_api_cpus_reservation)}
                         }
-            )
+            ))
         except docker.errors.APIError as e:
             logger.error(f"💥 Docker error launching State API: {e}")
 
@@ -283,8 +492,8 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
         """
         logger.info("Removing State API")
         try:
-            service = self.docker_client.services.get(self.STATE_API_SERVICE_NAME)
-            service.remove()
+            self._get_service(self.STATE_API_SERVICE_NAME).remove()
+            self._forget_service(self.STATE_API_SERVICE_NAME)
         except docker.errors.NotFound:
             logger.warning("  Routing State API not deployed on OpenFactory Swarm cluster")
         except docker.errors.APIError as e:
@@ -297,4 +506,4 @@ class SwarmDeploymentPlatform(DeploymentPlatform):
         Returns:
             str: URL of the State API.
         """
-        return f"http://{self.STATE_API_SERVICE_NAME}:5555"
+        return self._state_api_url
@@ -22,6 +22,7 @@ Main Components:
     - `get_all_groups()`: Lists all unique group names observed in the UNS mapping.
     - `get_all_assets_in_group(group_name)`: Lists asset UUIDs belonging to a specific group.
     - `create_derived_stream(group_name)`: Creates a stream for the specified group.
+    - `create_derived_streams_batch(group_names)`: Creates the streams of several groups in one ksqlDB request.
     - `remove_derived_stream(group_name)`: Drops the stream and its underlying Kafka topic.
     - `is_ready()`: Verifies readiness by checking the existence of the mapping table.
 
@@ -38,7 +39,9 @@ Dependencies:
     - `settings` for configuration of stream and table names.
 """
 
-from typing import List, Optional, Tuple
+import time
+from operator import methodcaller
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 from routing_layer.app.config import settings, ksql
 from routing_layer.app.core.logger import get_logger
 from routing_layer.app.core.controller.grouping_strategy import GroupingStrategy
@@ -48,12 +51,55 @@ from openfactory.kafka.ksql import KSQLDBClientException
 
 logger = get_logger(__name__)
 
+# Lifetime (in seconds) of the cached list of ksqlDB tables used by readiness checks
+TABLES_CACHE_TTL = 15.0
+
+# id(ksql client) → (expiry time, upper-cased ksqlDB table names)
+_tables_cache: Dict[int, Tuple[float, FrozenSet[str]]] = {}
+
+
+def cached_table_names(client: Any) -> FrozenSet[str]:
+    """
+    Return the upper-cased names of the ksqlDB tables, cached per client for `TABLES_CACHE_TTL` seconds.
+
+    Args:
+        client (Any): The ksqlDB client (e.g., `routing_layer.app.config.ksql`).
+
+    Returns:
+        FrozenSet[str]: Upper-cased table names.
+
+    Raises:
+        Exception: Whatever the client raises when ksqlDB cannot be reached (failures are not cached).
+    """
+    now = time.monotonic()
+    cached = _tables_cache.get(id(client))
+    if cached is None or cached[0] <= now:
+        cached = (now + TABLES_CACHE_TTL, frozenset(t.upper() for t in client.tables()))
+        _tables_cache[id(client)] = cached
+    return cached[1]
+
 
 def escape_ksql_literal(value: str) -> str:
     """ Escape single quotes for safe inclusion in ksqlDB string literals (SQL injection). """
     return value.replace("'", "''")
 
 
+def distinct_column_values(rows: Iterable[Dict[str, Any]], column: str) -> List[Any]:
+    """
+    Return the distinct non-empty values of a column over ksqlDB result rows.
+
+    Rows missing the column are skipped. The iteration runs in C (`map`, `filter`, `set`).
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): Rows as returned by `ksql.query()`.
+        column (str): The column name.
+
+    Returns:
+        List[Any]: The distinct values, in no particular order.
+    """
+    return list(set(filter(None, map(methodcaller("get", column), rows))))
+
+
 class UNSLevelGroupingStrategy(GroupingStrategy):
     """
     Example concrete grouping strategy: groups assets by a specified UNS level (e.g., workcenter, area).
@@ -73,6 +119,27 @@ class UNSLevelGroupingStrategy(GroupingStrategy):
             Uses `Settings.uns_fastapi_group_grouping_level` (e.g., 'workcenter', 'area') as the grouping key.
         """
         self.grouping_level = escape_ksql_literal(settings.uns_fastapi_group_grouping_level)
+        self._expected_table = settings.ksqldb_uns_map.upper()
+
+        # Statement templates, only the per-group fields are substituted at call time
+        self._assets_query_tpl = f"""
+        SELECT ASSET_UUID
+        FROM {settings.ksqldb_uns_map}
+        WHERE UNS_LEVELS['{self.grouping_level}'] = '{{group}}';
+        """
+        self._derived_stream_tpl = f"""
+        CREATE STREAM IF NOT EXISTS {{stream}}
+           WITH (
+             KAFKA_TOPIC='{{stream}}_topic',
+             VALUE_FORMAT='JSON'
+           ) AS
+        SELECT s.*
+        FROM {settings.ksqldb_assets_stream} s
+        JOIN asset_to_uns_map h
+        ON s.asset_uuid = h.asset_uuid
+        WHERE h.uns_levels['{self.grouping_level}'] = '{{group}}';
+        """
+        self._drop_stream_tpl = "DROP STREAM {stream} DELETE TOPIC;"
 
         ready, reason = self.is_ready()
         if not ready:
@@ -84,7 +151,8 @@ class UNSLevelGroupingStrategy(GroupingStrategy):
         Check if the grouping strategy is ready.
 
         This method verifies that the configured UNS mapping table exists in ksqlDB,
-        ensuring the strategy can operate properly.
+        ensuring the strategy can operate properly. The list of ksqlDB tables is cached
+        for `TABLES_CACHE_TTL` seconds.
 
         Returns:
             A tuple where the first element is a boolean indicating readiness,
@@ -92,9 +160,7 @@ class UNSLevelGroupingStrategy(GroupingStrategy):
             or error.
         """
         try:
-            expected_table = settings.ksqldb_uns_map.upper()
-            actual_tables = [t.upper() for t in ksql.tables()]
-            if expected_table not in actual_tables:
+            if self._expected_table not in cached_table_names(ksql):
                 return False, f"UNS mapping table '{settings.ksqldb_uns_map}' not found in ksqlDB"
             return True, "ok"
         except Exception as e:
@@ -133,9 +199,7 @@ class UNSLevelGroupingStrategy(GroupingStrategy):
         FROM {settings.ksqldb_uns_map};
         """
         try:
-            rows = ksql.query(query)
-            groups = [row.get("GROUPS") for row in rows if row.get("GROUPS")]
-            return list(set(groups))  # deduplicate
+            return distinct_column_values(ksql.query(query), "GROUPS")
         except Exception as e:
             logger.error(f"Error querying all groups: {e}")
             return []
@@ -150,19 +214,28 @@ class UNSLevelGroupingStrategy(GroupingStrategy):
         Returns:
             List[str]: A list of asset UUIDs in the group.
         """
-        query = f"""
-        SELECT ASSET_UUID
-        FROM {settings.ksqldb_uns_map}
-        WHERE UNS_LEVELS['{self.grouping_level}'] = '{escape_ksql_literal(group_name)}';
-        """
+        query = self._assets_query_tpl.format(group=escape_ksql_literal(group_name))
         try:
-            rows = ksql.query(query)
-            assets = [row.get("ASSET_UUID") for row in rows if row.get("ASSET_UUID")]
-            return list(set(assets))  # deduplicate
+            return distinct_column_values(ksql.query(query), "ASSET_UUID")
         except Exception as e:
             logger.error(f"Error querying all assets from group {group_name}: {e}")
             return []
 
+    def _derived_stream_statement(self, group_name: str) -> str:
+        """
+        Build the ksqlDB statement creating the derived stream of a group.
+
+        Args:
+            group_name (str): The name of the group to create the stream for.
+
+        Returns:
+            str: The `CREATE STREAM ... AS SELECT` statement.
+        """
+        return self._derived_stream_tpl.format(
+            stream=self._get_stream_name(group_name),
+            group=escape_ksql_literal(group_name)
+        )
+
     def create_derived_stream(self, group_name: str) -> None:
         """
         Create a derived stream for the specified group using a ksqlDB query.
@@ -173,23 +246,29 @@ class UNSLevelGroupingStrategy(GroupingStrategy):
         Returns:
             None
         """
-        statement = f"""
-        CREATE STREAM IF NOT EXISTS {self._get_stream_name(group_name)}
-           WITH (
-             KAFKA_TOPIC='{self._get_stream_name(group_name)}_topic',
-             VALUE_FORMAT='JSON'
-           ) AS
-        SELECT s.*
-        FROM {settings.ksqldb_assets_stream} s
-        JOIN asset_to_uns_map h
-        ON s.asset_uuid = h.asset_uuid
-        WHERE h.uns_levels['{self.grouping_level}'] = '{escape_ksql_literal(group_name)}';
-        """
+        statement = self._derived_stream_statement(group_name)
         pretty_statement = "\n".join("                  " + line.lstrip() for line in statement.strip().splitlines())
         logger.info(f"🔧 Creating derived stream for group {group_name}")
         logger.debug(pretty_statement)
         ksql.statement_query(statement)
 
+    def create_derived_streams_batch(self, group_names: List[str]) -> None:
+        """
+        Create the derived streams of several groups with a single ksqlDB request.
+
+        ksqlDB executes the statements of a request in order, so all streams are created in one round-trip.
+
+        Args:
+            group_names (List[str]): The names of the groups to create the streams for.
+
+        Returns:
+            None
+        """
+        if not group_names:
+            return
+        logger.info(f"🔧 Creating derived streams for groups {', '.join(group_names)}")
+        ksql.statement_query("".join(self._derived_stream_statement(group) for group in group_names))
+
     def remove_derived_stream(self, group_name: str) -> None:
         """
         Remove the derived stream associated with the specified group.
@@ -201,7 +280,7 @@ class UNSLevelGroupingStrategy(GroupingStrategy):
             None
         """
         stream_name = self._get_stream_name(group_name)
-        statement = f"DROP STREAM {stream_name} DELETE TOPIC;"
+        statement = self._drop_stream_tpl.format(stream=stream_name)
         logger.info(f" Removing derived stream with statement: {statement}")
         try:
             if stream_name.upper() not in ksql.streams():
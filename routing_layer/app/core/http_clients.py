@@ -0,0 +1,82 @@
+"""
+Shared HTTP Clients for OpenFactory Routing Layer.
+
+This module provides the factory functions for the two long-lived `httpx.AsyncClient`
+instances shared by the whole routing layer:
+
+- The request client (`build_http_client`), for short requests:
+    - Proxying `/asset_state` requests to the State API.
+    - Sending readiness probes to the group services and the State API.
+- The stream client (`build_stream_http_client`), for proxying `/asset_stream`
+  requests to the group services.
+
+Reusing the clients keeps TCP connections alive between requests, avoiding
+a new connection handshake and pool teardown on every proxied call. Proxied
+asset streams hold their connection for as long as the client stays subscribed,
+so they get their own pool and cannot exhaust the connections needed by the
+State API proxy and the readiness probes.
+
+Usage:
+    The clients are created and closed by the FastAPI application lifespan
+    (see `routing_layer.app.main`) and exposed on `app.state`:
+
+    .. code-block:: python
+
+        client: httpx.AsyncClient = request.app.state.http_client
+        response = await client.get(url)
+
+        stream_client: httpx.AsyncClient = request.app.state.stream_http_client
+"""
+
+import httpx
+from routing_layer.app.config import settings
+
+
+def build_http_client() -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client used for short requests.
+
+    Timeouts are split per stage (connect, read, write, pool) and configured
+    via `settings.http_timeouts`, so that a stuck connection attempt fails early
+    without consuming the whole read budget.
+
+    The pool size is configured via `settings.http_max_connections` and
+    `settings.http_max_keepalive_connections`.
+
+    Returns:
+        httpx.AsyncClient: An async client with keep-alive connection pooling.
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(**settings.http_timeouts),
+        limits=httpx.Limits(
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            max_connections=settings.http_max_connections,
+            keepalive_expiry=15.0,
+        ),
+    )
+
+
+def build_stream_http_client() -> httpx.AsyncClient:
+    """
+    Create the pooled HTTP client used for proxying long-lived asset streams.
+
+    Connect, write and pool timeouts are taken from `settings.http_timeouts`.
+    There is no read timeout, as streams may stay idle between events.
+
+    The pool size is configured via `settings.http_stream_max_connections` and
+    `settings.http_stream_max_keepalive_connections`, independently of the request
+    client. Each connection serves one subscribed client for as long as it stays
+    subscribed, so the connection limit bounds the number of concurrent streams.
+
+    Returns:
+        httpx.AsyncClient: An async client with keep-alive connection pooling.
+    """
+    timeouts = settings.http_timeouts
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(connect=timeouts["connect"], read=None, write=timeouts["write"], pool=timeouts["pool"]),
+        limits=httpx.Limits(
+            max_keepalive_connections=settings.http_stream_max_keepalive_connections,
+            max_connections=settings.http_stream_max_connections,
+            keepalive_expiry=15.0,
+        ),
+    )
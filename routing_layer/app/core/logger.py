@@ -5,15 +5,31 @@ This module configures logging to support:
 - Context-aware logger selection (CLI vs FastAPI/Uvicorn)
 - Colored log levels (INFO, WARNING, etc.) for CLI
 - Aligned logger names with fixed-width formatting for readability
+- Non-blocking emission: CLI records are queued and written by a background listener thread
 
 Usage:
     - In CLI scripts: call `setup_logging()` once at startup.
+    - In the API process: call `queue_logger_handlers(name)` at startup to move the handlers
+      of a logger (e.g., "uvicorn") behind a queue, and `restore_logger_handlers()` at shutdown.
     - To obtain a logger, use `get_logger(name)`.
 """
 
+import atexit
 import logging
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 from routing_layer.app.config import settings
 
+_queue_listener: Optional[QueueListener] = None
+
+
+@lru_cache(maxsize=256)
+def _bracketed_name(name: str, width: int) -> str:
+    """ Return the logger name in brackets, padded to `width` characters. """
+    return f"[{name}]".ljust(width)
+
 
 class ShortNameFormatter(logging.Formatter):
     """
@@ -32,6 +48,7 @@ class ShortNameFormatter(logging.Formatter):
     }
     RESET_COLOR = '\033[0m'
     NAME_WIDTH = 25                 # Fixed width for logger name field
+    NAME_PREFIX = "routing_layer.app.core.controller."
 
     def __init__(self, fmt: str, use_colors: bool = True):
         """
@@ -43,6 +60,10 @@ class ShortNameFormatter(logging.Formatter):
         """
         super().__init__(fmt)
         self.use_colors = use_colors
+        self._prefix_len = len(self.NAME_PREFIX)
+        self._colored_levels = {
+            level: f"{color}{level}{self.RESET_COLOR}" for level, color in self.LEVEL_COLORS.items()
+        } if use_colors else {}
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -55,38 +76,97 @@ class ShortNameFormatter(logging.Formatter):
         Returns:
             str: Formatted log message.
         """
-        prefix = "routing_layer.app.core.controller."
-        if record.name.startswith(prefix):
-            record.name = record.name.replace(prefix, "")
+        name = record.name
+        if name.startswith(self.NAME_PREFIX):
+            name = name[self._prefix_len:]
+        record.name = _bracketed_name(name, self.NAME_WIDTH)
 
-        bracketed_name = f"[{record.name}]"
-        bracketed_name = bracketed_name.ljust(self.NAME_WIDTH)
-        record.name = bracketed_name
-
-        if self.use_colors and record.levelname in self.LEVEL_COLORS:
-            color = self.LEVEL_COLORS[record.levelname]
-            record.levelname = f"{color}{record.levelname}{self.RESET_COLOR}"
+        record.levelname = self._colored_levels.get(record.levelname, record.levelname)
 
         return super().format(record)
 
 
+def _stop_queue_listener() -> None:
+    """ Flush the pending log records and stop the background listener thread. """
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
 def setup_logging():
     """
     Configure the root logger with custom formatter.
 
     This should be called once at the beginning of any CLI script
     that wants clean, readable log output.
+
+    Log records are put on a queue by a `QueueHandler` and written to the console
+    by a single `QueueListener` thread, so that threads deploying or tearing down
+    groups in parallel do not block on console output. The listener is stopped
+    (and the queue flushed) at interpreter exit.
     """
+    global _queue_listener
+
     formatter = ShortNameFormatter('%(levelname)s  %(name)s   %(message)s', use_colors=True)
     handler = logging.StreamHandler()
     handler.setFormatter(formatter)
 
+    if _queue_listener is None:
+        atexit.register(_stop_queue_listener)
+    else:
+        _queue_listener.stop()
+
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _queue_listener.start()
+
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
     root_logger.setLevel(settings.log_level.upper())
 
 
+def queue_logger_handlers(name: str) -> Optional[QueueListener]:
+    """
+    Move the handlers of a logger behind a queue emptied by a background listener thread.
+
+    Log calls made on the event loop then only enqueue the record; formatting and
+    console writes happen on the listener thread.
+
+    Note:
+        Only suitable for handlers whose formatter does not rely on `record.args`
+        (e.g., not for the Uvicorn access logger), as queued records are pre-formatted.
+
+    Args:
+        name (str): The logger name (e.g., "uvicorn").
+
+    Returns:
+        Optional[QueueListener]: The started listener, or None if the logger has no handlers to move.
+    """
+    target = logging.getLogger(name)
+    handlers = [h for h in target.handlers if not isinstance(h, QueueHandler)]
+    if not handlers:
+        return None
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    target.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
+def restore_logger_handlers(name: str, listener: Optional[QueueListener]) -> None:
+    """
+    Flush and stop a listener started by `queue_logger_handlers()` and reattach its handlers.
+
+    Args:
+        name (str): The logger name.
+        listener (Optional[QueueListener]): The listener returned by `queue_logger_handlers()`.
+    """
+    if listener is None:
+        return
+    listener.stop()
+    logging.getLogger(name).handlers = list(listener.handlers)
+
+
 def get_logger(name: str = None) -> logging.Logger:
     """
     Return the appropriate logger instance depending on context.
@@ -5,8 +5,9 @@ This module defines the `asset_stream_proxy` function used to forward client
 requests to the appropriate group-specific FastAPI service responsible for
 streaming asset data.
 
-It opens a streaming connection (`text/event-stream`) to the target URL,
-forwards client disconnection signals, and handles basic upstream error reporting.
+It opens a streaming connection (`text/event-stream`) to the target URL using the
+application-wide stream HTTP client (`app.state.stream_http_client`), forwards client
+disconnection signals, and handles basic upstream error reporting.
 
 The proxy expects:
 - A valid full URL pointing to a group-specific endpoint.
@@ -15,6 +16,8 @@ The proxy expects:
 Responsibilities:
 - Forward SSE streams transparently from upstream services.
 - Handle upstream connection errors and emit appropriate error events.
+- Evict the cached route of the asset when its group service is unreachable or
+  reports the stream as missing, so the next request resolves it again.
 - Respect client disconnections to avoid unnecessary load.
 
 Used by:
@@ -23,29 +26,61 @@ Used by:
 
 from fastapi import APIRouter, Request
 from starlette.responses import StreamingResponse
+from typing import Optional
+import asyncio
 import httpx
 import logging
+from routing_layer.app.dependencies import routing_controller
 
 logger = logging.getLogger("uvicorn.error")
 router = APIRouter()
 
+# Preencoded parts of the SSE error events sent to clients
+ERROR_FRAME_PREFIX = b"event: error\ndata: "
+FRAME_SUFFIX = b"\n\n"
+
+# Upstream status codes hinting that the cached route of the asset is stale
+STALE_ROUTE_STATUS_CODES = frozenset({404, 502, 503, 504})
+
+
+async def watch_disconnect(request: Request, disconnected: asyncio.Event) -> None:
+    """
+    Wait for the client to disconnect and signal it through an event.
+
+    Meant to run as a background task for the lifetime of a relayed stream, so that
+    the relay loop only checks a flag instead of polling the ASGI receive channel.
+
+    Args:
+        request (Request): The incoming request.
+        disconnected (asyncio.Event): Event set once the client has disconnected.
+    """
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            disconnected.set()
+            return
+
 
 @router.get("/asset_stream")
-async def asset_stream_proxy(request: Request, full_url: str) -> StreamingResponse:
+async def asset_stream_proxy(request: Request, full_url: str, asset_uuid: Optional[str] = None) -> StreamingResponse:
     """
     Proxy an incoming asset stream request to a downstream service.
 
-    This function establishes a streaming connection to the given `full_url`,
-    reads the response as a stream of SSE lines, and relays them back to the client.
+    This function establishes a streaming connection to the given `full_url`
+    and relays the upstream byte chunks to the client unchanged, without decoding
+    or re-framing the SSE events.
 
     It also:
     - Detects and handles upstream HTTP errors.
-    - Stops streaming if the client disconnects.
+    - Stops streaming if the client disconnects (signaled by a background `watch_disconnect` task).
     - Forwards error events to the client if proxying fails.
+    - Evicts the cached route of `asset_uuid` if the upstream cannot be reached or
+      answers with one of `STALE_ROUTE_STATUS_CODES`.
 
     Args:
         request (Request): The incoming FastAPI request, used to detect disconnections.
         full_url (str): The full URL to the target downstream group service.
+        asset_uuid (Optional[str]): UUID of the routed asset, whose cached route is evicted on upstream failure.
 
     Returns:
         StreamingResponse: A streaming response object that pipes data from upstream.
@@ -57,60 +92,81 @@ async def asset_stream_proxy(request: Request, full_url: str) -> StreamingRespon
         GET /asset_stream?asset_uuid=...
     """
     async def sse_stream():
-        logger.debug(f"[proxy] Will forward to {full_url}")
-        async with httpx.AsyncClient(timeout=None) as client:
-            try:
-                async with client.stream("GET", full_url, headers={"Accept": "text/event-stream"}) as response:
-                    if response.status_code != 200:
-                        content = await response.aread()
-                        logger.error(f"[proxy] Upstream error: {response.status_code} - {content}")
-                        yield f"event: error\ndata: {content.decode()}\n\n".encode()
-                        return
-
-                    logger.info("[proxy] Connected to SSE upstream")
-
-                    async for line in response.aiter_lines():
-                        if await request.is_disconnected():
-                            logger.info("[proxy] Client disconnected")
-                            break
-
-                        if line.strip():
-                            logger.debug(f"[proxy][SSE] {line}")
-                            yield (line + "\n").encode()
-
-                    logger.info("[proxy] Upstream stream ended")
-
-            except Exception as e:
-                logger.exception(f"[proxy] Error streaming from upstream: {e}")
-                yield f"event: error\ndata: {str(e)}\n\n".encode()
+        logger.debug("[proxy] Will forward to %s", full_url)
+        client: httpx.AsyncClient = request.app.state.stream_http_client
+        disconnected = asyncio.Event()
+        watcher = asyncio.create_task(watch_disconnect(request, disconnected))
+        try:
+            async with client.stream("GET", full_url, headers={"Accept": "text/event-stream"}) as response:
+                if response.status_code != 200:
+                    content = await response.aread()
+                    logger.error("[proxy] Upstream error: %s - %s", response.status_code, content)
+                    if asset_uuid is not None and response.status_code in STALE_ROUTE_STATUS_CODES:
+                        routing_controller.evict_route(asset_uuid)
+                    yield ERROR_FRAME_PREFIX + content + FRAME_SUFFIX
+                    return
+
+                logger.info("[proxy] Connected to SSE upstream")
+
+                debug = logger.isEnabledFor(logging.DEBUG)
+                async for chunk in response.aiter_bytes():
+                    if disconnected.is_set():
+                        logger.info("[proxy] Client disconnected")
+                        break
+
+                    if debug:
+                        logger.debug("[proxy][SSE] %r", chunk)
+                    yield chunk
+
+                logger.info("[proxy] Upstream stream ended")
+
+        except httpx.PoolTimeout as e:
+            logger.error("[proxy] No upstream connection available: %s", e)
+            yield ERROR_FRAME_PREFIX + str(e).encode() + FRAME_SUFFIX
+        except httpx.TransportError as e:
+            logger.exception("[proxy] Transport error streaming from upstream: %s", e)
+            if asset_uuid is not None:
+                routing_controller.evict_route(asset_uuid)
+            yield ERROR_FRAME_PREFIX + str(e).encode() + FRAME_SUFFIX
+        except Exception as e:
+            logger.exception("[proxy] Error streaming from upstream: %s", e)
+            yield ERROR_FRAME_PREFIX + str(e).encode() + FRAME_SUFFIX
+        finally:
+            watcher.cancel()
 
     return StreamingResponse(sse_stream(), media_type="text/event-stream")
 
 
 async def read_and_log_sse_stream(request: Request, full_url: str):
     async def sse_iterator():
-        async with httpx.AsyncClient(timeout=None) as client:
-            try:
-                async with client.stream("GET", full_url, headers={"Accept": "text/event-stream"}) as response:
-                    if response.status_code != 200:
-                        content = await response.aread()
-                        logger.error(f"[proxy] Upstream error: {response.status_code} - {content}")
-                        yield f"event: error\ndata: {content.decode()}\n\n".encode()
-                        return
-
-                    logger.info("[proxy] Connected to upstream SSE")
-
-                    async for line in response.aiter_lines():
-                        if await request.is_disconnected():
-                            logger.info("[proxy] Client disconnected")
-                            break
-
-                        if line.strip():
-                            logger.info(f"[proxy][SSE] {line}")
-                            yield (line + "\n").encode()
-
-            except Exception as e:
-                logger.exception("[proxy] Exception while streaming SSE")
-                yield f"event: error\ndata: {str(e)}\n\n".encode()
+        client: httpx.AsyncClient = request.app.state.stream_http_client
+        disconnected = asyncio.Event()
+        watcher = asyncio.create_task(watch_disconnect(request, disconnected))
+        try:
+            async with client.stream("GET", full_url, headers={"Accept": "text/event-stream"}) as response:
+                if response.status_code != 200:
+                    content = await response.aread()
+                    logger.error("[proxy] Upstream error: %s - %s", response.status_code, content)
+                    yield ERROR_FRAME_PREFIX + content + FRAME_SUFFIX
+                    return
+
+                logger.info("[proxy] Connected to upstream SSE")
+
+                log_lines = logger.isEnabledFor(logging.INFO)
+                async for line in response.aiter_lines():
+                    if disconnected.is_set():
+                        logger.info("[proxy] Client disconnected")
+                        break
+
+                    if line.strip():
+                        if log_lines:
+                            logger.info("[proxy][SSE] %s", line)
+                        yield (line + "\n").encode()
+
+        except Exception as e:
+            logger.exception("[proxy] Exception while streaming SSE")
+            yield ERROR_FRAME_PREFIX + str(e).encode() + FRAME_SUFFIX
+        finally:
+            watcher.cancel()
 
     return StreamingResponse(sse_iterator(), media_type="text/event-stream")
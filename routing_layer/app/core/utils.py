@@ -9,7 +9,9 @@ It enables flexible configuration of pluggable components such as:
   - Deployment platforms (entry point group: `openfactory.deployment_platforms`)
 
 Plugins are selected based on the names provided via environment variables in the
-application settings.
+application settings. Instead of an entry point name, a dotted import path
+(`package.module:attribute`) can be given to import the plugin directly, without
+scanning the installed entry points.
 
 Example:
     .. code-block:: python
@@ -19,11 +21,30 @@ Example:
         strategy_cls = load_plugin("openfactory.grouping_strategies", "workcenter")
         strategy = strategy_cls()
 
+        # Same plugin, imported directly
+        strategy_cls = load_plugin(
+            "openfactory.grouping_strategies",
+            "routing_layer.app.core.controller.unslevel_grouping_strategy:UNSLevelGroupingStrategy"
+        )
+
 Raises:
     ValueError: If no matching plugin is found for the given group and name.
 """
 
-from importlib.metadata import entry_points
+import importlib
+from functools import lru_cache
+from importlib.metadata import EntryPoints, entry_points
+
+
+@lru_cache(maxsize=1)
+def _all_entry_points() -> EntryPoints:
+    """
+    Return all installed entry points, scanned once per process.
+
+    Returns:
+        EntryPoints: The entry points of all installed distributions.
+    """
+    return entry_points()
 
 
 def load_plugin(group: str, name: str):
@@ -32,14 +53,28 @@ def load_plugin(group: str, name: str):
 
     Args:
         group (str): Entry point group name.
-        name (str): Name of the registered plugin.
+        name (str): Name of the registered plugin, or a dotted import path
+            (`package.module:attribute` or `package.module.attribute`) which is
+            imported directly, bypassing the entry points of `group`.
 
     Returns:
         The loaded plugin object (class or function).
+
+    Raises:
+        ValueError: If no entry point named `name` exists in `group`.
+        ImportError: If a dotted import path cannot be imported.
+        AttributeError: If the module of a dotted import path has no such attribute.
+
+    Note:
+        The installed entry points are scanned once per process; plugins installed
+        afterwards are not discovered until restart. Loaded plugins are not memoized
+        here; the routing controller caches the classes it loads.
     """
-    eps = entry_points().select(group=group)
-    for ep in eps:
-        if ep.name == name:
-            return ep.load()
+    if ":" in name or "." in name:
+        module_path, _, attr = name.rpartition(":") if ":" in name else name.rpartition(".")
+        return getattr(importlib.import_module(module_path), attr)
 
-    raise ValueError(f"No entry point named '{name}' found in group '{group}'")
+    ep = next(iter(_all_entry_points().select(group=group, name=name)), None)
+    if ep is None:
+        raise ValueError(f"No entry point named '{name}' found in group '{group}'")
+    return ep.load()
@@ -39,35 +39,82 @@ Exposed Endpoints:
 
 import uvicorn
 import os
+import orjson
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
-from typing import Dict
+from fastapi.responses import Response
 from routing_layer.app.config import settings
 from routing_layer.app.dependencies import routing_controller
+from routing_layer.app.core.http_clients import build_http_client, build_stream_http_client
+from routing_layer.app.core.logger import queue_logger_handlers, restore_logger_handlers
 from routing_layer.app.api.router_asset import router as assets_router
 from routing_layer.app.api.router_asset_state import router as asset_state_router
 
 
+# Pre-encoded bodies of the constant probe responses
+HEALTH_OK_BODY = orjson.dumps({"status": "ok"})
+READY_OK_BODY = orjson.dumps({"status": "ready"})
+
+# Application metadata, fixed for the lifetime of the process
+APP_INFO_BODY = orjson.dumps({
+    "version": os.environ.get("APPLICATION_VERSION", "local-dev"),
+    "build_origin": os.environ.get("APPLICATION_MANUFACTURER", "local-dev"),
+    "openfactory_version": os.environ.get("OPENFACTORY_VERSION", "local-dev"),
+})
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan handler.
+
+    Creates the HTTP clients shared by the proxies and readiness probes
+    when the app starts, and closes them cleanly during shutdown.
+
+    The Uvicorn console handlers are moved behind a queue for the lifetime
+    of the app, so that logging from request handlers does not block the
+    event loop on console writes.
+
+    Args:
+        app (FastAPI): The FastAPI application instance.
+
+    Yields:
+        None
+    """
+    log_listener = queue_logger_handlers("uvicorn")
+    app.state.http_client = build_http_client()
+    app.state.stream_http_client = build_stream_http_client()
+    routing_controller.use_http_client(app.state.http_client)
+    try:
+        yield
+    finally:
+        await routing_controller.aclose()
+        await app.state.stream_http_client.aclose()
+        await app.state.http_client.aclose()
+        restore_logger_handlers("uvicorn", log_listener)
+
+
 app = FastAPI(
     title="OpenFactory API Routing Layer",
-    description="Routing layer for the OpenFactory serving layer"
+    description="Routing layer for the OpenFactory serving layer",
+    lifespan=lifespan
 )
 
 
 @app.get("/health", include_in_schema=False)
-async def health_check() -> Dict[str, str]:
+async def health_check() -> Response:
     """
     Liveness probe endpoint.
 
     Returns:
-        JSON object with status "ok". This confirms that the API process is
+        Response: JSON object with status "ok". This confirms that the API process is
         running and responsive, but does not guarantee service dependencies are healthy.
     """
-    return {"status": "ok"}
+    return Response(content=HEALTH_OK_BODY, media_type="application/json")
 
 
 @app.get("/ready", include_in_schema=False)
-async def readiness_check() -> JSONResponse:
+async def readiness_check() -> Response:
     """
     Readiness probe endpoint.
 
@@ -76,18 +123,20 @@ async def readiness_check() -> JSONResponse:
         - Deployment platform readiness (e.g., Docker Swarm manager availability)
 
     Returns:
-        JSONResponse: A JSON response indicating readiness status.
-                      If ready, returns {"status": "ready"} with HTTP 200.
-                      If not ready, returns HTTP 503 with content {"status": "not ready", "issues": <message>}.
+        Response: A JSON response indicating readiness status.
+                        If ready, returns {"status": "ready"} with HTTP 200.
+                        If not ready, returns HTTP 503 with content {"status": "not ready", "issues": <message>}.
     """
-    ready, issues = routing_controller.is_ready()
+    ready, issues = await routing_controller.is_ready()
     if not ready:
-        return JSONResponse(status_code=503, content={"status": "not ready", "issues": issues})
-    return JSONResponse(status_code=200, content={"status": "ready"})
+        return Response(
+            content=orjson.dumps({"status": "not ready", "issues": issues}),
+            status_code=503, media_type="application/json")
+    return Response(content=READY_OK_BODY, media_type="application/json")
 
 
 @app.get("/info", summary="Get application metadata")
-async def get_app_info() -> JSONResponse:
+async def get_app_info() -> Response:
     """
     Application metadata endpoint.
 
@@ -96,24 +145,25 @@ async def get_app_info() -> JSONResponse:
         - Build origin
         - OpenFactory platform version
 
+    The metadata is read from the environment once, when the module is imported.
+
     Returns:
-        JSONResponse: A JSON response containing application metadata with HTTP 200.
+        Response: A JSON response containing application metadata with HTTP 200.
     """
-    version = os.environ.get("APPLICATION_VERSION", "local-dev")
-    build_origin = os.environ.get("APPLICATION_MANUFACTURER", "local-dev")
-    ofa_version = os.environ.get("OPENFACTORY_VERSION", "local-dev")
-    return JSONResponse(content={
-        "version": version,
-        "build_origin": build_origin,
-        "openfactory_version": ofa_version
-    })
+    return Response(content=APP_INFO_BODY, media_type="application/json")
 
 
 app.include_router(assets_router)
 app.include_router(asset_state_router)
 
 if __name__ == "__main__":
+    # Auto-reload only for local development; it watches the source tree and allows a single worker
+    reload = settings.environment == "local"
+    workers = 1 if reload else (settings.uvicorn_workers or os.cpu_count() or 1)
     uvicorn.run("routing_layer.app.main:app",
                 host="0.0.0.0", port=5555,
-                reload=True,
+                reload=reload,
+                workers=workers,
+                loop=settings.uvicorn_loop,
+                http=settings.uvicorn_http,
                 log_level=settings.log_level)
@@ -24,10 +24,7 @@ Environment Variable:
 """
 
 import sys
-import uvicorn
-import subprocess
 from pathlib import Path
-from routing_layer.app.config import settings
 
 
 # Resolve the project root dynamically based on this file's location
@@ -40,7 +37,9 @@ def main():
     Main entrypoint for the manage CLI.
 
     Parses the first command-line argument and dispatches to the
-    appropriate functionality: deploy, teardown, or runserver.
+    appropriate functionality: deploy, teardown, runserver, or build.
+    Each command imports its own dependencies, so that e.g. `build`
+    does not load Uvicorn or the application settings.
 
     Raises:
         SystemExit: If no command or an unknown command is provided,
@@ -61,12 +60,18 @@ def main():
         run_teardown()
 
     elif command == "runserver":
+        import uvicorn
+        from routing_layer.app.config import settings
         uvicorn.run("routing_layer.app.main:app",
                     host="0.0.0.0", port=5555,
                     reload=True,
+                    loop=settings.uvicorn_loop,
+                    http=settings.uvicorn_http,
                     log_level=settings.log_level)
 
     elif command == "build":
+        import subprocess
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
         builds = [
             # (Dockerfile relative to project root, image tag, context relative to project root)
@@ -75,21 +80,32 @@ def main():
             ("state_api/Dockerfile", "ofa/state-api", "state_api"),
         ]
 
-        for dockerfile_rel, tag, context_rel in builds:
+        def build_image(dockerfile_rel, tag, context_rel):
             dockerfile = PROJECT_ROOT.joinpath(dockerfile_rel)
             context = PROJECT_ROOT.joinpath(context_rel)
-            print(f"\n🔨 Building image: {tag} from {dockerfile} (context: {context})")
-
-            try:
-                subprocess.run([
-                    "docker", "build",
-                    "-f", dockerfile,
-                    "-t", tag,
-                    context
-                ], check=True)
-            except subprocess.CalledProcessError as e:
-                print(f"❌ Failed to build {tag}")
-                sys.exit(e.returncode)
+            print(f"🔨 Building image: {tag} from {dockerfile} (context: {context})")
+            return subprocess.run([
+                "docker", "build",
+                "-f", dockerfile,
+                "-t", tag,
+                context
+            ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+        # The images are independent, so they are built concurrently;
+        # the output of each build is printed once it finishes
+        failed = []
+        with ThreadPoolExecutor(max_workers=len(builds)) as executor:
+            futures = {executor.submit(build_image, *build): build[1] for build in builds}
+            for future in as_completed(futures):
+                tag = futures[future]
+                result = future.result()
+                print(f"\n----- {tag} -----\n{result.stdout}")
+                if result.returncode != 0:
+                    print(f"❌ Failed to build {tag}")
+                    failed.append(result.returncode)
+
+        if failed:
+            sys.exit(failed[0])
 
         print("\n✅ All images built successfully.")
 
@@ -13,7 +13,8 @@ The endpoint supports:
     - Fetching all current DataItems of an asset
 
 Security:
-    - Input values are escaped to prevent injection attacks.
+    - `asset_uuid` and `id` must match `IDENTIFIER_PATTERN` (letters, digits, `.`, `_`, `:`
+      and `-`); other values are rejected with HTTP 422 before any query is built.
     - Only safe string literals are interpolated in ksqlDB queries.
 
 Usage:
@@ -28,8 +29,10 @@ Endpoint:
     GET /asset_state
 
 Query Parameters:
-    - `asset_uuid`: (str) Required asset UUID.
-    - `id`: (Optional[str]) Optional DataItem ID.
+    - `asset_uuid`: (str) Required asset UUID (at most 128 characters).
+    - `id`: (Optional[str]) Optional DataItem ID (at most 128 characters).
+    - `limit`: (int) Maximum number of DataItems returned when `id` is omitted
+      (default 1000, at most 10000).
 
 Example:
     .. code-block:: bash
@@ -37,28 +40,97 @@ Example:
         curl http://localhost:5555/asset_state?asset_uuid=WTVB01-001&id=avail
 """
 
+import asyncio
 import logging
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
-from state_api.config import settings, ksql
-
-
-# ksqlDB table of Assets with composite key
-KSQLDB_ASSETS_TABLE = settings.ksqldb_assets_table
+import orjson
+from functools import lru_cache
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from openfactory.kafka import KSQLDBClient
+from state_api.config import get_settings, ksql_dependency
+
+
+# ksqlDB queries for one DataItem (by composite key) and for all DataItems of an asset,
+# on the table of Assets named by the settings; asset_uuid is known from the request,
+# so it is not selected by the latter
+DATAITEM_QUERY = (
+    "SELECT asset_uuid, id, value, type, tag, timestamp FROM {table} "
+    "WHERE key = '%s|%s' LIMIT 1;"
+)
+DATAITEMS_QUERY = (
+    "SELECT id, value, type, tag, timestamp FROM {table} "
+    "WHERE asset_uuid = '%s' LIMIT %d;"
+)
+
+# Allowed asset UUIDs and DataItem IDs (cannot contain quotes)
+IDENTIFIER_PATTERN = r"^[A-Za-z0-9._:\-]{1,128}$"
+
+# Default and maximum number of DataItems returned for an asset
+DATAITEMS_DEFAULT_LIMIT = 1000
+DATAITEMS_MAX_LIMIT = 10000
+
+# Fields of a DataItem in the response, and the matching ksqlDB columns
+DATAITEM_FIELDS = ("id", "value", "type", "tag", "timestamp")
+DATAITEM_COLUMNS = tuple(field.upper() for field in DATAITEM_FIELDS)
+
+# Number of DataItems encoded per chunk of a streamed response
+STREAM_BATCH_SIZE = 256
 
 logger = logging.getLogger("uvicorn.error")
 router = APIRouter()
 
 
-def escape_ksql_literal(value: str) -> str:
-    """ Escape single quotes for safe inclusion in ksqlDB string literals (SQL injection). """
-    return value.replace("'", "''")
+@lru_cache(maxsize=1)
+def query_templates() -> Tuple[str, str]:
+    """ Return the DataItem and DataItems query templates for the configured table, built on first use. """
+    table = get_settings().ksqldb_assets_table
+    return DATAITEM_QUERY.format(table=table), DATAITEMS_QUERY.format(table=table)
+
+
+@lru_cache(maxsize=4096)
+def dataitem_query(asset_uuid: str, dataitem_id: str) -> str:
+    """ Build (and memoize) the ksqlDB query for the state of one DataItem of an asset (validated identifiers). """
+    return query_templates()[0] % (asset_uuid, dataitem_id)
+
+
+@lru_cache(maxsize=4096)
+def dataitems_query(asset_uuid: str, limit: int) -> str:
+    """ Build (and memoize) the ksqlDB query for all DataItems of an asset (validated identifier). """
+    return query_templates()[1] % (asset_uuid, limit)
+
+
+async def stream_dataitems(asset_uuid: str, rows: List[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Encode the DataItems of an asset as a JSON document, chunk by chunk.
+
+    Yields the `{"asset_uuid": ..., "dataItems": [` prefix, then the DataItems in
+    batches of `STREAM_BATCH_SIZE`, then the closing brackets, so that encoding
+    overlaps with sending and the full document is never held in memory.
+
+    Args:
+        asset_uuid (str): The UUID of the asset.
+        rows (List[Dict[str, Any]]): Rows as returned by `ksql.query()`.
+
+    Yields:
+        bytes: Consecutive chunks of the JSON document.
+    """
+    yield b'{"asset_uuid":' + orjson.dumps(asset_uuid) + b',"dataItems":['
+    for start in range(0, len(rows), STREAM_BATCH_SIZE):
+        chunk = b",".join(
+            orjson.dumps(dict(zip(DATAITEM_FIELDS, map(row.get, DATAITEM_COLUMNS))))
+            for row in rows[start:start + STREAM_BATCH_SIZE]
+        )
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]}"
 
 
 @router.get("/asset_state")
 async def get_asset_state(
-    asset_uuid: str = Query(...),
-    dataitem_id: Optional[str] = Query(None, alias="id")
+    asset_uuid: str = Query(..., pattern=IDENTIFIER_PATTERN),
+    dataitem_id: Optional[str] = Query(None, alias="id", pattern=IDENTIFIER_PATTERN),
+    limit: int = Query(DATAITEMS_DEFAULT_LIMIT, ge=1, le=DATAITEMS_MAX_LIMIT),
+    ksql: KSQLDBClient = Depends(ksql_dependency)
 ):
     """
     Retrieve the state of an asset or one of its specific DataItem from ksqlDB.
@@ -72,11 +144,14 @@ async def get_asset_state(
         id (Optional[str]): Optional. The ID of the DataItem within the asset.
             If provided, returns data only for this specific DataItem.
             If omitted, returns all DataItems for the asset.
+        limit (int): Maximum number of DataItems returned when `id` is omitted.
+        ksql (KSQLDBClient): The ksqlDB client, injected by FastAPI.
 
     Returns:
-        dict: Response data. The structure depends on whether `id` is provided.
+        Response | StreamingResponse: JSON response data. The structure depends on whether `id` is provided.
+            All DataItems of an asset are streamed as a JSON document.
 
-    When `id` is provided, the dictionary contains:
+    When `id` is provided, the JSON object contains:
         asset_uuid (str): Asset UUID.
         id (str): DataItem ID.
         value (str): DataItem value.
@@ -84,7 +159,7 @@ async def get_asset_state(
         tag (str): DataItem tag.
         timestamp (str): Timestamp of the DataItem.
 
-    When `id` is not provided, the dictionary contains:
+    When `id` is not provided, the JSON object contains:
         asset_uuid (str): Asset UUID.
         dataItems (list of dict): List of DataItems, each dict includes:
             id (str): DataItem ID.
@@ -95,6 +170,7 @@ async def get_asset_state(
 
     Raises:
         HTTPException:
+            - 422 if `asset_uuid` or `id` is not a valid identifier.
             - 404 if no matching asset or DataItem is found.
             - 500 if there is an error querying the ksqlDB instance.
 
@@ -149,20 +225,12 @@ async def get_asset_state(
         }
         ```
     """
-    escaped_asset_uuid = escape_ksql_literal(asset_uuid)
     if dataitem_id:
-        escaped_dataitem_id = escape_ksql_literal(dataitem_id)
-        composite_key = f"{escaped_asset_uuid}|{escaped_dataitem_id}"
-        ksql_query = f"""
-        SELECT asset_uuid, id, value, type, tag, timestamp
-        FROM {KSQLDB_ASSETS_TABLE}
-        WHERE key = '{composite_key}'
-        LIMIT 1;
-        """
+        ksql_query = dataitem_query(asset_uuid, dataitem_id)
         try:
-            rows = ksql.query(ksql_query)
+            rows = await asyncio.to_thread(ksql.query, ksql_query)
         except Exception as e:
-            logger.error(f"[asset_state API] ksqlDB query failed: {type(e).__name__}: {e}")
+            logger.error("[asset_state API] ksqlDB query failed: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"ksqlDB query failed: {type(e).__name__}: {e}")
 
         if not rows:
@@ -170,44 +238,26 @@ async def get_asset_state(
             raise HTTPException(status_code=404, detail="No data found for the given asset_uuid and id.")
 
         row = rows[0]
-        return {
+        return Response(content=orjson.dumps({
             "asset_uuid": row.get("ASSET_UUID"),
             "id": row.get("ID"),
             "value": row.get("VALUE"),
             "type": row.get("TYPE"),
             "tag": row.get("TAG"),
             "timestamp": row.get("TIMESTAMP"),
-        }
+        }), media_type="application/json")
 
     else:
         # Case: Query for all DataItems of the asset
-        ksql_query = f"""
-        SELECT asset_uuid, id, value, type, tag, timestamp
-        FROM {KSQLDB_ASSETS_TABLE}
-        WHERE asset_uuid = '{escaped_asset_uuid}';
-        """
+        ksql_query = dataitems_query(asset_uuid, limit)
         try:
-            rows = ksql.query(ksql_query)
+            rows = await asyncio.to_thread(ksql.query, ksql_query)
         except Exception as e:
-            logger.error(f"[asset_state API] ksqlDB query failed: {type(e).__name__}: {e}")
+            logger.error("[asset_state API] ksqlDB query failed: %s: %s", type(e).__name__, e)
             raise HTTPException(status_code=500, detail=f"ksqlDB query failed: {type(e).__name__}: {e}")
 
         if not rows:
             logger.info("[asset_state API] No data found for the given asset_uuid.")
             raise HTTPException(status_code=404, detail="No data found for the given asset_uuid.")
 
-        data_items = [
-            {
-                "id": row.get("ID"),
-                "value": row.get("VALUE"),
-                "type": row.get("TYPE"),
-                "tag": row.get("TAG"),
-                "timestamp": row.get("TIMESTAMP"),
-            }
-            for row in rows
-        ]
-
-        return {
-            "asset_uuid": asset_uuid,
-            "dataItems": data_items,
-        }
+        return StreamingResponse(stream_dataitems(asset_uuid, rows), media_type="application/json")
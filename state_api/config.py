@@ -12,22 +12,26 @@ For local development, environment variables can be defined in a `.env` file loc
 Unknown environment variables are ignored to allow shared `.env` files across multiple services.
 
 Usage:
-    Import the singleton `settings` object from this module to access configuration values
-    throughout the application.
+    Call `get_settings()` to access configuration values and `get_ksql()` to access the
+    ksqlDB client throughout the application. Both are created on first use and then
+    reused, so importing this module does not validate the settings or create the client.
 
     .. code-block:: python
-        from state_api.config import settings
+        from state_api.config import get_settings
 
-        print(settings.ksqldb_url)
+        print(get_settings().ksqldb_url)
 
 Environment Variables:
     - `KSQLDB_URL`: URL to ksqlDB.
     - `LOG_LEVEL`: Logging verbosity level.
+    - `ENVIRONMENT`: Current environment; "local" runs a single auto-reloading process (default: "production").
+    - `UVICORN_WORKERS`: Number of Uvicorn worker processes; 0 starts one per CPU (default: 1).
 
 Note:
     Ensure that your deployment environment or tool provides all required environment variables
     before starting the application.
 """
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
 from openfactory.kafka import KSQLDBClient
@@ -46,6 +50,10 @@ class Settings(BaseSettings):
         ksqldb_assets_table (str): ksqlDB tables with Assets states. Environment variable: KSQLDB_ASSETS_TABLE
         log_level (str): Logging level, e.g., "info", "debug", "warning".
             Environment variable: LOG_LEVEL
+        environment (str): Environment the app is running in, e.g., "local" or "production".
+            Environment variable: ENVIRONMENT
+        uvicorn_workers (int): Number of Uvicorn worker processes (0 starts one per CPU).
+            Environment variable: UVICORN_WORKERS
 
     Note:
         - The deployment tool is responsible for setting these environment variables.
@@ -55,6 +63,8 @@ class Settings(BaseSettings):
     ksqldb_url: str = Field(default="http://localhost:8088", env="KSQLDB_URL")
     ksqldb_assets_table: str = Field(default="assets", env="KSQLDB_ASSETS_TABLE")
     log_level: str = Field(default="info", env="LOG_LEVEL")
+    environment: str = Field(default="production", env="ENVIRONMENT")
+    uvicorn_workers: int = Field(default=1, ge=0, env="UVICORN_WORKERS")
 
     model_config = {
         "env_file": ".env",               # can be used for local development
@@ -71,6 +81,18 @@ class Settings(BaseSettings):
         return v.lower()
 
 
-# Singleton settings and ksql object
-settings = Settings()
-ksql = KSQLDBClient(settings.ksqldb_url)
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """ Return the singleton application settings, loading them on first use. """
+    return Settings()
+
+
+@lru_cache(maxsize=1)
+def get_ksql() -> KSQLDBClient:
+    """ Return the singleton ksqlDB client, creating it on first use. """
+    return KSQLDBClient(get_settings().ksqldb_url)
+
+
+async def ksql_dependency() -> KSQLDBClient:
+    """ FastAPI dependency providing the ksqlDB client (async, so FastAPI resolves it without a threadpool hop). """
+    return get_ksql()
@@ -6,7 +6,7 @@ including the registration of the asset_state router which exposes
 the `/asset_state` REST endpoint to query the latest factory asset states.
 
 It also launches the Uvicorn ASGI server when run as the main module,
-using configuration values from the `settings` singleton.
+using configuration values from `state_api.config.get_settings()`.
 
 Usage:
     Run locally for development:
@@ -17,21 +17,43 @@ Usage:
 
 Environment variables from `state_api.config.Settings` control
 behavior such as logging level and ksqlDB connection.
+
+The ksqlDB client (`state_api.config.get_ksql()`) is created once per worker process
+and keeps its HTTP connections alive across requests; it is closed when the
+application shuts down.
 """
+import os
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from state_api.config import settings
+from state_api.config import get_settings, get_ksql
 from state_api.app import asset_state
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """ Release the pooled ksqlDB connections of this worker on shutdown. """
+    try:
+        yield
+    finally:
+        if get_ksql.cache_info().currsize:
+            get_ksql().close()
+
+
 app = FastAPI(
     title="OpenFactory State API",
     description="Serving current state data of factory assets.",
+    lifespan=lifespan,
 )
 app.include_router(asset_state.router)
 
 if __name__ == "__main__":
+    settings = get_settings()
+    # Auto-reload only for local development; it watches the source tree and allows a single worker
+    reload = settings.environment.lower() == "local"
+    workers = 1 if reload else (settings.uvicorn_workers or os.cpu_count() or 1)
     uvicorn.run("state_api.main:app",
                 host="0.0.0.0", port=5555,
-                reload=True,
+                reload=reload,
+                workers=workers,
                 log_level=settings.log_level)
@@ -2,16 +2,40 @@
 import logging
 from fastapi import APIRouter, Request, Query
 from sse_starlette.sse import EventSourceResponse
-from typing import Optional
-import asyncio
-import json
+from typing import Final, Optional
+import orjson
 from stream_api.non_replicated.config import settings
-from stream_api.non_replicated.app.core.kafka_dispatcher import subscriptions
+from stream_api.non_replicated.app.core.kafka_dispatcher import SubscriberQueue, subscribe, unsubscribe
 
 
 logger = logging.getLogger("uvicorn.error")
 router = APIRouter()
 
+# Maximum number of messages buffered per subscriber
+QUEUE_MAXSIZE: Final[int] = settings.queue_maxsize
+
+# Framing of an `asset_update` SSE event around a single-line payload
+SSE_EVENT_PREFIX = b"event: asset_update\r\ndata: "
+SSE_EVENT_SUFFIX = b"\r\n\r\n"
+
+
+def encode_event(payload: bytes):
+    """
+    Frame a raw Kafka payload as an `asset_update` SSE event.
+
+    Single-line payloads (the usual compact JSON) are framed as bytes directly, without
+    decoding them; multi-line payloads are decoded and left to `EventSourceResponse` to split.
+
+    Args:
+        payload (bytes): The raw message payload.
+
+    Returns:
+        bytes | dict: The encoded event, or the event as a dict for `EventSourceResponse`.
+    """
+    if b"\n" in payload or b"\r" in payload:
+        return {"event": "asset_update", "data": payload.decode("utf-8")}
+    return SSE_EVENT_PREFIX + payload + SSE_EVENT_SUFFIX
+
 
 @router.get("/asset_stream")
 async def stream_asset_state(
@@ -46,8 +70,8 @@ async def stream_asset_state(
         GET /asset_stream?asset_uuid=PROVER3018&id=Zact
         ```
     """
-    queue = asyncio.Queue(maxsize=settings.queue_maxsize)
-    subscriptions[asset_uuid].append(queue)
+    queue = SubscriberQueue(maxsize=QUEUE_MAXSIZE)
+    subscribe(asset_uuid, queue)
     logger.info(f"[SSE] Client subscribed to {asset_uuid}")
 
     async def event_generator():
@@ -56,20 +80,16 @@ async def stream_asset_state(
                 msg = await queue.get()
                 try:
                     if dataitem_id:
-                        parsed = json.loads(msg)
+                        parsed = orjson.loads(msg)
                         if parsed.get("id") != dataitem_id:
                             continue  # skip non-matching dataitem_id
-                    yield {
-                        "event": "asset_update",
-                        "data": msg
-                    }
+                    yield encode_event(msg)
                 except Exception as e:
                     logger.error(f"[SSE] Failed to process message: {e}")
         finally:
-            if queue in subscriptions.get(asset_uuid, []):
-                subscriptions[asset_uuid].remove(queue)
-            if not subscriptions.get(asset_uuid):
-                subscriptions.pop(asset_uuid, None)
+            unsubscribe(asset_uuid, queue)
+            if queue.dropped:
+                logger.warning(f"[SSE] {queue.dropped} messages dropped for slow client of {asset_uuid}")
             logger.info(f"[SSE] Client disconnected from {asset_uuid}")
 
     return EventSourceResponse(event_generator())
@@ -12,10 +12,29 @@ Delivery Guarantees and Design Notes:
   one subscriber queue. This avoids losing messages but may cause duplicates
   if a crash occurs after dispatch but before commit.
 
+- **Batched consumption and periodic commits**:
+  Messages are consumed in batches of up to `BATCH_SIZE`. The offsets of the
+  dispatched messages are committed asynchronously every `COMMIT_EVERY` messages
+  or `COMMIT_INTERVAL_S` seconds, whichever comes first, and once more on shutdown.
+  A crash may therefore replay up to that many already dispatched messages.
+
+- **Prefetching**:
+  A fetcher thread consumes the next batches (up to `PREFETCH_DEPTH`) while the
+  dispatcher thread fans out the current one. Prefetched batches not yet
+  dispatched at shutdown are not committed and are replayed on restart.
+
+- **Rebalancing**:
+  When partitions are revoked, the pending offsets of the revoked partitions are
+  committed and dropped, and the batches consumed before the revocation are
+  discarded instead of being dispatched or committed; the new owner of the
+  partitions resumes from the last committed offsets.
+
 - **Backpressure-safe**:
   Messages are asynchronously queued for subscribers and only marked as done
   (offset committed) after dispatch, ensuring reliable delivery and enabling
-  buffering if consumers are slow.
+  buffering if consumers are slow. Subscriber queues are bounded; when the
+  queue of a slow subscriber is full, its oldest message is dropped to make
+  room for the new one.
 
 - **Buffer-safe and Durable**:
   Uncommitted messages remain in Kafka if the dispatcher crashes or restarts,
@@ -31,25 +50,178 @@ import asyncio
 import logging
 import threading
 import time
-from typing import DefaultDict, List, Tuple
-from collections import defaultdict
-from confluent_kafka import Consumer, KafkaException
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple
+from confluent_kafka import Consumer, KafkaException, Message, TopicPartition
 from stream_api.non_replicated.config import settings
 
-# Kafka configurations
-KAFKA_BOOTSTRAP_SERVERS = settings.kafka_broker
-KAFKA_TOPIC = settings.kafka_topic
-KAFKA_GROUP_ID = settings.kafka_consumer_group_id
+# Kafka configurations (read once from the settings, as the dispatcher loops use them constantly)
+KAFKA_BOOTSTRAP_SERVERS: Final[str] = settings.kafka_broker
+KAFKA_TOPIC: Final[str] = settings.kafka_topic
+KAFKA_GROUP_ID: Final[str] = settings.kafka_consumer_group_id
+BATCH_SIZE: Final[int] = settings.batch_size
+CONSUME_TIMEOUT_S: Final[float] = settings.consume_timeout_s
+COMMIT_EVERY: Final[int] = settings.commit_every
+COMMIT_INTERVAL_S: Final[float] = settings.commit_interval_s
+PREFETCH_DEPTH: Final[int] = settings.prefetch_depth
+
+# librdkafka fetch tuning: let the broker coalesce records per fetch, without long stalls
+# on quiet topics, while keeping the local prefetch queue bounded
+KAFKA_FETCH_CONF: Final[Dict[str, Any]] = {
+    'fetch.min.bytes': settings.fetch_min_bytes,
+    'fetch.wait.max.ms': settings.fetch_wait_max_ms,
+    'queued.max.messages.kbytes': settings.queued_max_kbytes,
+    'max.partition.fetch.bytes': settings.max_partition_fetch_bytes,
+}
+
+# Maximum number of per-message errors logged per second by the dispatcher
+MAX_ERROR_LOGS_PER_S = 10
 
 # Global subscription registry
-# Maps asset_uuid (str) to a list of asyncio Queues corresponding to subscribers.
-subscriptions: DefaultDict[str, List[asyncio.Queue]] = defaultdict(list)
+# Maps the UTF-8 encoded asset_uuid (bytes, as found in the Kafka message keys) to a tuple
+# of asyncio Queues corresponding to subscribers.
+# The queues receive the raw (undecoded) Kafka message payloads.
+# Copy-on-write: the tuples are never mutated, `subscribe`/`unsubscribe` replace them,
+# so the dispatcher thread can read the registry without locking.
+subscriptions: Dict[bytes, Tuple[asyncio.Queue, ...]] = {}
 
 # logger
 logger = logging.getLogger("uvicorn.error")
 
 
-def build_shared_consumer(topic: str, consumer_group_id: str) -> Consumer:
+class SubscriberQueue(asyncio.Queue):
+    """
+    Bounded queue of a subscriber, counting the messages dropped because the subscriber
+    did not keep up.
+
+    Attributes:
+        dropped (int): Number of messages dropped from this queue.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self.dropped = 0
+
+
+def subscribe(asset_uuid: str, queue: asyncio.Queue) -> None:
+    """
+    Register a subscriber queue for the messages of an asset.
+
+    Args:
+        asset_uuid (str): UUID of the asset.
+        queue (asyncio.Queue): Queue receiving the raw message payloads.
+    """
+    key = asset_uuid.encode("utf-8")
+    subscriptions[key] = subscriptions.get(key, ()) + (queue,)
+
+
+def unsubscribe(asset_uuid: str, queue: asyncio.Queue) -> None:
+    """
+    Remove a subscriber queue of an asset; the asset is dropped from the registry
+    once it has no subscribers left.
+
+    Args:
+        asset_uuid (str): UUID of the asset.
+        queue (asyncio.Queue): Queue registered with `subscribe`.
+    """
+    key = asset_uuid.encode("utf-8")
+    queues = tuple(q for q in subscriptions.get(key, ()) if q is not queue)
+    if queues:
+        subscriptions[key] = queues
+    else:
+        subscriptions.pop(key, None)
+
+
+def _fanout(queues: Tuple[asyncio.Queue, ...], value: bytes) -> None:
+    """
+    Put a message on the queues of its subscribers (runs on the event loop).
+
+    When a queue is full, its oldest message is dropped (and counted) to make room,
+    so that a stalled subscriber sheds load instead of growing memory.
+
+    Args:
+        queues (Tuple[asyncio.Queue, ...]): Subscriber queues of the message's asset.
+        value (bytes): The raw message payload.
+    """
+    for q in queues:
+        try:
+            q.put_nowait(value)
+        except asyncio.QueueFull:
+            q.get_nowait()
+            q.put_nowait(value)
+            q.dropped += 1
+            if q.dropped == 1:
+                logger.warning("[Kafka Dispatcher] Subscriber too slow, dropping its oldest messages")
+
+
+def _fanout_batch(deliveries: List[Tuple[Tuple[asyncio.Queue, ...], bytes]]) -> None:
+    """
+    Fan out a batch of messages to their subscribers, in order (runs on the event loop).
+
+    Args:
+        deliveries (List[Tuple[Tuple[asyncio.Queue, ...], bytes]]): Subscriber queues and
+            raw payload of each dispatched message.
+    """
+    for queues, value in deliveries:
+        _fanout(queues, value)
+
+
+def dispatch_batch(msgs: List[Message], loop: asyncio.AbstractEventLoop,
+                   offsets: Dict[int, int], on_error: Callable[[Exception], None]) -> int:
+    """
+    Fan out a batch of Kafka messages to the queues of their subscribers.
+
+    This is the per-message hot path of the dispatcher thread; lookups used for every
+    message are bound to locals once per batch. The messages with subscribers are
+    handed to the event loop with a single callback per batch, whatever the number of
+    messages and subscribers.
+
+    Args:
+        msgs (List[Message]): Messages returned by `Consumer.consume()`.
+        loop (asyncio.AbstractEventLoop): Event loop owning the subscriber queues.
+        offsets (Dict[int, int]): Updated in place with the next offset to commit
+            per partition (of `KAFKA_TOPIC`) of the dispatched messages.
+        on_error (Callable[[Exception], None]): Called with the error of a message that
+            could not be dispatched.
+
+    Returns:
+        int: Number of messages dispatched to at least one subscriber.
+    """
+    get_queues = subscriptions.get
+    deliveries = []
+    deliver = deliveries.append
+    # partition → next offset, committed only once the batch is handed over
+    batch_offsets: Dict[int, int] = {}
+    for msg in msgs:
+        if msg.error():
+            continue
+        try:
+            queues = get_queues(msg.key() or b"")
+            if queues:
+                deliver((queues, msg.value()))
+                batch_offsets[msg.partition()] = msg.offset() + 1
+        except Exception as e:
+            on_error(e)
+
+    if not deliveries:
+        return 0
+    try:
+        loop.call_soon_threadsafe(_fanout_batch, deliveries)
+    except Exception as e:
+        on_error(e)
+        return 0
+    offsets.update(batch_offsets)
+    return len(deliveries)
+
+
+def _on_commit(err, partitions):
+    """ Log failed offset commits (called by librdkafka from `poll`/`consume`). """
+    if err:
+        logger.error(f"[Kafka Consumer] Offset commit failed: {err}")
+
+
+def build_shared_consumer(topic: str, consumer_group_id: str,
+                          on_revoke: Optional[Callable[[Consumer, List[TopicPartition]], None]] = None) -> Consumer:
     """
     Build and return a Kafka consumer subscribed to the specified topic,
     configured with a shared consumer group for fan-out of messages.
@@ -57,6 +229,8 @@ def build_shared_consumer(topic: str, consumer_group_id: str) -> Consumer:
     Args:
         topic (str): Kafka topic name to subscribe to.
         consumer_group_id (str): Kafka consumer group ID.
+        on_revoke (Optional[Callable[[Consumer, List[TopicPartition]], None]]): Called by librdkafka
+            (from `poll`/`consume`/`close`) with the partitions revoked from the consumer.
 
     Returns:
         Consumer: Configured confluent_kafka Consumer instance.
@@ -66,21 +240,29 @@ def build_shared_consumer(topic: str, consumer_group_id: str) -> Consumer:
         'group.id': consumer_group_id,
         'auto.offset.reset': 'latest',
         'enable.auto.commit': False,
+        'on_commit': _on_commit,
+        **KAFKA_FETCH_CONF,
     }
     consumer = Consumer(conf)
-    consumer.subscribe([topic])
+    assigned = threading.Event()
+
+    def on_assign(consumer, partitions):
+        assigned.set()
+
+    callbacks = {'on_assign': on_assign}
+    if on_revoke is not None:
+        callbacks['on_revoke'] = on_revoke
+    consumer.subscribe([topic], **callbacks)
     logger.info(f"[Kafka Consumer] Subscribe to {topic} at {KAFKA_BOOTSTRAP_SERVERS}")
 
     # Wait until the consumer is assigned a partition
     logger.info("[Kafka Consumer] Waiting for partition assignment...")
-    deadline = time.time() + 100  # max 100 seconds wait
-    partitions = []
-    while time.time() < deadline:
-        consumer.poll(0.1)  # triggers background work
-        partitions = consumer.assignment()
-        if partitions:
-            break
+    is_assigned, mono, poll = assigned.is_set, time.monotonic, consumer.poll
+    deadline = mono() + 100  # max 100 seconds wait
+    while not is_assigned() and mono() < deadline:
+        poll(0.1)  # drives the group join; serves the on_assign callback
 
+    partitions = consumer.assignment()
     if not partitions:
         raise KafkaException("[Kafka Consumer] failed to get partition assignment.")
 
@@ -90,8 +272,8 @@ def build_shared_consumer(topic: str, consumer_group_id: str) -> Consumer:
 
 class KafkaDispatcher:
     """
-    KafkaDispatcher runs a background thread that polls Kafka and fans out messages
-    to asyncio queues for subscribed clients.
+    KafkaDispatcher runs a background thread that fans out messages to asyncio queues
+    for subscribed clients, fed with batches polled from Kafka by a fetcher thread.
 
     Supports graceful shutdown to allow proper consumer group rebalancing.
     """
@@ -101,38 +283,171 @@ class KafkaDispatcher:
         self._stop_event = threading.Event()
         self.consumer = None
         self.thread = None
+        self.fetcher = None
+        # partition → TopicPartition of KAFKA_TOPIC, reused by every commit
+        self._topic_partitions: Dict[int, TopicPartition] = {}
+        # partition of KAFKA_TOPIC → next offset to commit, for the dispatched messages
+        self._offsets: Dict[int, int] = {}
+        # Incremented on every revocation; batches consumed in an older generation are discarded
+        self._generation = 0
+        # Guards the offsets, the generation and the commits, shared with the rebalance callback
+        self._offsets_lock = threading.Lock()
+        # Rate limiting of per-message error logs: start of the current 1 s window,
+        # errors logged and errors suppressed within it
+        self._error_window = 0.0
+        self._errors_logged = 0
+        self._errors_suppressed = 0
 
     def start(self):
         """ Start the dispatcher background thread. """
         def run():
-            self.consumer = build_shared_consumer(KAFKA_TOPIC, KAFKA_GROUP_ID)
+            self.consumer = build_shared_consumer(KAFKA_TOPIC, KAFKA_GROUP_ID, on_revoke=self._on_revoke)
             logger.info("[Kafka Dispatcher] Started Kafka consumer.")
+            offsets, lock = self._offsets, self._offsets_lock
+            uncommitted = 0
+            batches: Queue = Queue(maxsize=PREFETCH_DEPTH)
+            # Bound once, as they are used on every iteration
+            stopped, mono, get_batch = self._stop_event.is_set, time.monotonic, batches.get
+            last_commit = mono()
+            self.fetcher = threading.Thread(target=self._fetch, args=(batches,), daemon=True)
+            self.fetcher.start()
             try:
-                while not self._stop_event.is_set():
-                    msg = self.consumer.poll(1.0)
-                    if msg is None or msg.error():
-                        continue
+                while not stopped():
                     try:
-                        asset_uuid = msg.key().decode("utf-8") if msg.key() else ""
-                        value = msg.value().decode("utf-8")
-
-                        queues = subscriptions.get(asset_uuid)
-                        if queues:
-                            for q in queues:
-                                asyncio.run_coroutine_threadsafe(q.put(value), self.loop)
-                            self.consumer.commit(message=msg, asynchronous=False)
-
-                    except Exception as e:
-                        logger.error(f"[Kafka Dispatcher] Error: {e}")
+                        generation, msgs = get_batch(timeout=CONSUME_TIMEOUT_S)
+                    except Empty:
+                        generation, msgs = -1, ()
+                    if msgs and generation == self._generation:
+                        batch_offsets: Dict[int, int] = {}
+                        dispatched = dispatch_batch(msgs, self.loop, batch_offsets, self._log_error)
+                        if batch_offsets:
+                            with lock:
+                                # Partitions revoked during the dispatch are no longer ours to commit
+                                if generation == self._generation:
+                                    offsets.update(batch_offsets)
+                                    uncommitted += dispatched
+
+                    if offsets:
+                        now = mono()
+                        if uncommitted >= COMMIT_EVERY or now - last_commit >= COMMIT_INTERVAL_S:
+                            with lock:
+                                if offsets:
+                                    self._commit(offsets, asynchronous=True)
+                                    offsets.clear()
+                            uncommitted = 0
+                            last_commit = now
             finally:
-                logger.info("[Kafka Dispatcher] Closing consumer...")
-                if self.consumer:
+                # Also stops the fetcher if the dispatch loop failed
+                self._stop_event.set()
+                self.fetcher.join(timeout=5)
+                if self.fetcher.is_alive():
+                    # Never commit through or close a consumer the fetcher is still using
+                    logger.error("[Kafka Dispatcher] Fetcher thread did not stop, leaving the consumer open.")
+                elif self.consumer:
+                    logger.info("[Kafka Dispatcher] Closing consumer...")
+                    with lock:
+                        if offsets:
+                            self._commit(offsets, asynchronous=False)
+                            offsets.clear()
                     self.consumer.close()
-                logger.info("[Kafka Dispatcher] Consumer closed.")
+                    logger.info("[Kafka Dispatcher] Consumer closed.")
 
         self.thread = threading.Thread(target=run, daemon=True)
         self.thread.start()
 
+    def _fetch(self, batches: Queue) -> None:
+        """
+        Consume batches of messages ahead of their dispatch (runs in the fetcher thread).
+
+        Each batch is handed over with the rebalance generation current when `consume()`
+        returned it, so that the dispatcher can discard the batches queued before a revocation.
+
+        Args:
+            batches (Queue): Bounded queue handing the consumed batches to the dispatcher thread.
+        """
+        stopped, consume, put_batch = self._stop_event.is_set, self.consumer.consume, batches.put
+        while not stopped():
+            # consume() only returns early on a full batch, so its timeout bounds both the
+            # delivery delay on quiet topics and how long a stop request goes unnoticed
+            msgs = consume(num_messages=BATCH_SIZE, timeout=CONSUME_TIMEOUT_S)
+            if not msgs:
+                continue
+            # Read after consuming: a rebalance is served from within consume(), and the messages
+            # it returns after a revocation already belong to the new assignment
+            generation = self._generation
+            while not stopped():
+                try:
+                    put_batch((generation, msgs), timeout=CONSUME_TIMEOUT_S)
+                    break
+                except Full:
+                    continue
+
+    def _on_revoke(self, consumer: Consumer, partitions: List[TopicPartition]) -> None:
+        """
+        Handle the revocation of partitions (called by librdkafka from `consume`/`close`).
+
+        Commits the pending offsets of the revoked partitions while they are still owned,
+        drops them, and starts a new generation so that the batches consumed before the
+        revocation are neither dispatched nor committed. With the default (eager) rebalance
+        protocol all partitions are revoked, and consumption of the partitions assigned next
+        resumes from their committed offsets.
+
+        Args:
+            consumer (Consumer): The consumer whose partitions are revoked.
+            partitions (List[TopicPartition]): The revoked partitions.
+        """
+        logger.info(f"[Kafka Dispatcher] Partitions revoked: {partitions}")
+        with self._offsets_lock:
+            self._generation += 1
+            revoked = {tp.partition: offset for tp in partitions
+                       if (offset := self._offsets.pop(tp.partition, None)) is not None}
+            if revoked:
+                self._commit(revoked, asynchronous=False)
+
+    def _log_error(self, error: Exception) -> None:
+        """
+        Log a per-message dispatch error, at most `MAX_ERROR_LOGS_PER_S` times per second.
+
+        Errors beyond the limit are counted and reported once the next window starts,
+        so that a storm of malformed messages does not flood the logs.
+
+        Args:
+            error (Exception): The error raised while dispatching a message.
+        """
+        now = time.monotonic()
+        if now - self._error_window >= 1.0:
+            if self._errors_suppressed:
+                logger.error("[Kafka Dispatcher] %d more errors suppressed", self._errors_suppressed)
+            self._error_window = now
+            self._errors_logged = 0
+            self._errors_suppressed = 0
+        if self._errors_logged < MAX_ERROR_LOGS_PER_S:
+            self._errors_logged += 1
+            logger.error("[Kafka Dispatcher] Error: %s", error)
+        else:
+            self._errors_suppressed += 1
+
+    def _commit(self, offsets: Dict[int, int], asynchronous: bool) -> None:
+        """
+        Commit the given offsets of the consumer.
+
+        Args:
+            offsets (Dict[int, int]): Next offset to commit per partition of `KAFKA_TOPIC`.
+            asynchronous (bool): If True, do not wait for the broker to acknowledge the commit;
+                failures are then reported to `_on_commit`.
+        """
+        tps = []
+        for partition, offset in offsets.items():
+            tp = self._topic_partitions.get(partition)
+            if tp is None:
+                tp = self._topic_partitions[partition] = TopicPartition(KAFKA_TOPIC, partition)
+            tp.offset = offset
+            tps.append(tp)
+        try:
+            self.consumer.commit(offsets=tps, asynchronous=asynchronous)
+        except KafkaException as e:
+            logger.error(f"[Kafka Dispatcher] Commit failed: {e}")
+
     def stop(self):
         """ Signal the dispatcher to stop and wait for clean shutdown. """
         logger.info("[Kafka Dispatcher] Stop signal received.")
@@ -146,7 +461,7 @@ class KafkaDispatcher:
         Check whether the Kafka dispatcher is connected and assigned partitions.
 
         This method verifies that:
-        - The dispatcher thread is running.
+        - The dispatcher and fetcher threads are running.
         - The Kafka consumer has been initialized.
         - The consumer has received partition assignments from the broker.
 
@@ -157,6 +472,8 @@ class KafkaDispatcher:
         """
         if not self.thread or not self.thread.is_alive():
             return False, "Kafka dispatcher thread is not running"
+        if not self.fetcher or not self.fetcher.is_alive():
+            return False, "Kafka fetcher thread is not running"
         if not self.consumer:
             return False, "Kafka consumer is not initialized"
         partitions = self.consumer.assignment()
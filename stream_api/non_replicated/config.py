@@ -29,12 +29,26 @@ Environment Variables:
     - `KAFKA_TOPIC`: Kafka topic to consume from.
     - `KAFKA_CONSUMER_GROUP_ID`: Kafka consumer group identifier.
     - `QUEUE_MAXSIZE`: Maximum size of the internal Kafka message queue.
+    - `BATCH_SIZE`: Maximum number of Kafka messages consumed per poll.
+    - `CONSUME_TIMEOUT_S`: Maximum time in seconds a poll waits to fill a batch.
+    - `COMMIT_EVERY`: Number of dispatched messages after which offsets are committed.
+    - `COMMIT_INTERVAL_S`: Maximum time in seconds between two offset commits.
+    - `FETCH_MIN_BYTES`: Minimum amount of data the broker returns per fetch request.
+    - `FETCH_WAIT_MAX_MS`: Maximum time the broker waits to fill `FETCH_MIN_BYTES`.
+    - `QUEUED_MAX_KBYTES`: Maximum size of the consumer's local prefetch queue, in kilobytes.
+    - `MAX_PARTITION_FETCH_BYTES`: Maximum amount of data fetched per partition and request.
+    - `PREFETCH_DEPTH`: Number of consumed Kafka batches buffered ahead of their dispatch.
     - `LOG_LEVEL`: Logging verbosity level.
+    - `UVICORN_LOOP`: Event loop implementation used by Uvicorn ("auto", "asyncio", "uvloop";
+      default: "uvloop", or "auto" on Windows where uvloop is not available).
+    - `UVICORN_HTTP`: HTTP protocol implementation used by Uvicorn ("auto", "h11", "httptools"; default: "httptools").
+    - `DEV_RELOAD`: Set to "1" to run Uvicorn with auto-reload during local development (default: off).
 
 Note:
     Ensure that your deployment environment or tool provides all required environment variables
     before starting the application.
 """
+import sys
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
 
@@ -58,8 +72,34 @@ class Settings(BaseSettings):
             Environment variable: KAFKA_CONSUMER_GROUP_ID
         queue_maxsize (int): Maximum size of the internal message queue used to buffer Kafka messages before streaming.
             Environment variable: QUEUE_MAXSIZE
+        batch_size (int): Maximum number of Kafka messages consumed per poll.
+            Environment variable: BATCH_SIZE
+        consume_timeout_s (float): Maximum time in seconds a poll waits to fill a batch. Bounds both the
+            delivery delay of messages on quiet topics and the shutdown latency of the dispatcher.
+            Environment variable: CONSUME_TIMEOUT_S
+        commit_every (int): Number of dispatched messages after which their offsets are committed.
+            Environment variable: COMMIT_EVERY
+        commit_interval_s (float): Maximum time in seconds the offsets of dispatched messages stay uncommitted.
+            Environment variable: COMMIT_INTERVAL_S
+        fetch_min_bytes (int): Minimum amount of data the broker returns per fetch request (librdkafka
+            `fetch.min.bytes`). Environment variable: FETCH_MIN_BYTES
+        fetch_wait_max_ms (int): Maximum time the broker waits to fill `fetch_min_bytes` (librdkafka
+            `fetch.wait.max.ms`). Environment variable: FETCH_WAIT_MAX_MS
+        queued_max_kbytes (int): Maximum size of the consumer's local prefetch queue in kilobytes (librdkafka
+            `queued.max.messages.kbytes`). Environment variable: QUEUED_MAX_KBYTES
+        max_partition_fetch_bytes (int): Maximum amount of data fetched per partition and request (librdkafka
+            `max.partition.fetch.bytes`). Environment variable: MAX_PARTITION_FETCH_BYTES
+        prefetch_depth (int): Number of consumed Kafka batches buffered ahead of their dispatch.
+            Environment variable: PREFETCH_DEPTH
         log_level (str): Logging level, e.g., "info", "debug", "warning".
             Environment variable: LOG_LEVEL
+        uvicorn_loop (str): Event loop implementation used by Uvicorn ("auto", "asyncio" or "uvloop").
+            uvloop speeds up the cross-thread hand-off of Kafka messages to the event loop.
+            Environment variable: UVICORN_LOOP
+        uvicorn_http (str): HTTP protocol implementation used by Uvicorn ("auto", "h11" or "httptools").
+            Environment variable: UVICORN_HTTP
+        dev_reload (bool): Run Uvicorn with auto-reload (local development only).
+            Environment variable: DEV_RELOAD
 
     Note:
         - The deployment tool is responsible for setting these environment variables.
@@ -71,7 +111,19 @@ class Settings(BaseSettings):
     kafka_consumer_group_id: str = Field(default="ofa_openfactory-stream-api-non-replicated",
                                          env="KAFKA_CONSUMER_GROUP_ID")
     queue_maxsize: int = Field(default=1000, env="QUEUE_MAXSIZE")
+    batch_size: int = Field(default=500, gt=0, env="BATCH_SIZE")
+    consume_timeout_s: float = Field(default=0.1, gt=0, env="CONSUME_TIMEOUT_S")
+    commit_every: int = Field(default=1000, gt=0, env="COMMIT_EVERY")
+    commit_interval_s: float = Field(default=1.0, gt=0, env="COMMIT_INTERVAL_S")
+    fetch_min_bytes: int = Field(default=64 * 1024, gt=0, env="FETCH_MIN_BYTES")
+    fetch_wait_max_ms: int = Field(default=100, ge=0, env="FETCH_WAIT_MAX_MS")
+    queued_max_kbytes: int = Field(default=10 * 1024, gt=0, env="QUEUED_MAX_KBYTES")
+    max_partition_fetch_bytes: int = Field(default=4 * 1024 * 1024, gt=0, env="MAX_PARTITION_FETCH_BYTES")
+    prefetch_depth: int = Field(default=2, gt=0, env="PREFETCH_DEPTH")
     log_level: str = Field(default="info", env="LOG_LEVEL")
+    uvicorn_loop: str = Field(default="auto" if sys.platform == "win32" else "uvloop", env="UVICORN_LOOP")
+    uvicorn_http: str = Field(default="httptools", env="UVICORN_HTTP")
+    dev_reload: bool = Field(default=False, env="DEV_RELOAD")
 
     model_config = {
         "env_file": ".env",               # can be used for local development
@@ -28,6 +28,8 @@ Environment Variables:
     - KAFKA_TOPIC: Kafka topic to consume messages from.
     - KAFKA_CONSUMER_GROUP_ID: Kafka consumer group ID.
     - LOG_LEVEL: Logging verbosity ("debug", "info", "warning", etc.)
+    - UVICORN_LOOP / UVICORN_HTTP: Uvicorn event loop and HTTP implementations.
+    - DEV_RELOAD: Set to "1" to enable Uvicorn auto-reload for local development.
 """
 
 import asyncio
@@ -108,5 +110,7 @@ if __name__ == "__main__":
     setup_logging()
     uvicorn.run("stream_api.non_replicated.main:app",
                 host="0.0.0.0", port=5555,
-                reload=True,
+                reload=settings.dev_reload,
+                loop=settings.uvicorn_loop,
+                http=settings.uvicorn_http,
                 log_level=settings.log_level)